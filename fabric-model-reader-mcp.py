@@ -11,15 +11,14 @@ Example prompts to test this server:
 
 
 #region Imports
-import subprocess
-import json
-import os
-import time
-import base64
-import requests
-import keyring
-from fastmcp import FastMCP
-from typing import Optional, List, Dict, Any, Union
+import binascii
+import asyncio
+import hashlib
+import orjson
+from binascii import a2b_base64
+from fastmcp import FastMCP, Context
+from typing import Optional, Dict, Tuple
+from powerbi_client import FABRIC_API, POWERBI_API, send, wait_for_operation
 #endregion
 
 
@@ -27,113 +26,54 @@ from typing import Optional, List, Dict, Any, Union
 # Create server
 mcp = FastMCP("powerbi-server")
 
-# API endpoint constants
-POWERBI_API = "https://api.powerbi.com/v1.0/myorg"
-FABRIC_API = "https://api.fabric.microsoft.com/v1"
+# Output separators and static headers, built once (headers pre-encoded for the byte buffer)
+SEP_EQ = '=' * 40
+SEP_DASH = '─' * 40
+HEADER = f"Dataset Model Definition (TMDL Format)\n{SEP_EQ}\n".encode()
+NAVIGATION_HEADER = f"\n{SEP_DASH}\nNavigation:\n".encode()
 #endregion
 
 
 #region Helper Functions
-# Authentication function
-def get_access_token() -> str:
-    """Get access token in 1 of 3 different methods."""
-    # 1. First try to get token from environment variable
-    #    Store token in mcp.json securely as a password
-    #    or set it in your environment: export POWERBI_TOKEN
-    token = os.environ.get("POWERBI_TOKEN", "")
-    if token:
-        return token
-
-    # 2. Try Azure CLI
-    #    Run `az login` to authenticate first
-    try:
-        import platform
-        
-        # Use shell=True on Windows to ensure az.cmd is found
-        use_shell = platform.system() == "Windows"
-        
-        result = subprocess.run(
-            ["az", "account", "get-access-token", "--resource", "https://analysis.windows.net/powerbi/api"],
-            capture_output=True, 
-            text=True, 
-            check=True,
-            shell=use_shell
-        )
-        token_data = json.loads(result.stdout)
-        return token_data.get("accessToken", "")
-    except subprocess.CalledProcessError as e:
-        print(f"Azure CLI error: {e.stderr}")
-    except Exception as e:
-        print(f"Azure CLI auth failed: {str(e)}")
-
-    # 3. Try keyring as fallback
-    #    Run `keyring set powerbi token` to store your token securely
-    try:
-        return keyring.get_password("powerbi", "token") or ""
-    except Exception:
-        return ""
-
-# Get token
-TOKEN = get_access_token()
+def extract_dax_tables(body: bytes) -> Optional[bytes]:
+    """
+    Returns the `tables` array of an executeQueries response serialized as
+    2-space indented JSON. Returns None when there are no tables.
+    """
+    results = orjson.loads(body).get("results", [])
+    if results and "tables" in results[0]:
+        return orjson.dumps(results[0]["tables"], option=orjson.OPT_INDENT_2)
+    return None
 
-if not TOKEN:
-    print("WARNING: No authentication token found. Please authenticate using one of these methods:")
-    print("1. Set POWERBI_TOKEN environment variable")
-    print("2. Run 'az login' (Azure CLI)")
-    print("3. Use 'keyring set powerbi token' to store token")
 
-# Create session with default headers
-session = requests.Session()
-session.headers.update({
-    "Authorization": f"Bearer {TOKEN}",
-    "Content-Type": "application/json"
-})
+# In-flight DAX queries: (workspace_id, dataset_id, query hash) -> future of the tool result
+_inflight_dax: Dict[Tuple[str, str, str], "asyncio.Future[str]"] = {}
 
 
-# Function to make API requests with error handling
-def make_request(url: str, method: str = "GET", data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-    """
-    Makes an HTTP request to the specified URL.
-    Supports GET and POST methods with JSON data.
-    Returns JSON response or error message.
-    """
+async def run_dax_query(url: str, query: str) -> str:
+    """Executes a single DAX query and returns its result tables as JSON or an error message."""
     try:
-        response = session.request(method, url, json=data)
-        return response.json() if response.ok else {"error": f"HTTP {response.status_code}: {response.text[:200]}"}
+        response = await send("POST", url, {"queries": [{"query": query}]})
     except Exception as e:
-        return {"error": str(e)}
-
-
-# Function for LRO (Long Running Operation) handling
-def wait_for_operation(location_url: str, retry_seconds: int = 30) -> Dict[str, Any]:
-    """
-    Waits for a long-running operation to complete.
-    Polls the provided location URL until the operation is done.
-    Returns the final result or an error message.
-    """
-    while True:
-        time.sleep(retry_seconds)
-        response = session.get(location_url)
-        
-        if not response.ok:
-            return {"error": f"Failed to check status: {response.status_code}"}
-        
-        data = response.json()
-        status = data.get('status', '')
-        
-        if status == 'Succeeded':
-            result_response = session.get(f"{location_url}/result")
-            return result_response.json() if result_response.ok else {"error": "Failed to get result"}
-        elif status == 'Failed':
-            return {"error": data.get('error', 'Operation failed')}
+        return f"Error: {str(e)}"
+    
+    if not response.is_success:
+        return f"Error: HTTP {response.status_code}: {response.text[:200]}"
+    
+    # Return the actual data
+    try:
+        tables = extract_dax_tables(response.content)
+    except orjson.JSONDecodeError as e:
+        return f"Error: {str(e)}"
+    return tables.decode() if tables is not None else "No data returned"
 #endregion
 
 
 #region MCP Tools
 @mcp.tool()
-def get_model_definition(workspace_id: str, dataset_id: str, file_filter: Optional[str] = None, 
-                        page: Optional[int] = None, page_size: int = 10, metadata_only: bool = False,
-                        file_range: Optional[str] = None) -> str:
+async def get_model_definition(workspace_id: str, dataset_id: str, ctx: Context, file_filter: Optional[str] = None, 
+                              page: Optional[int] = None, page_size: int = 10, metadata_only: bool = False,
+                              file_range: Optional[str] = None) -> str:
     """
     Get the TMDL definition of a semantic model with pagination and filtering support.
     
@@ -150,17 +90,20 @@ def get_model_definition(workspace_id: str, dataset_id: str, file_filter: Option
     Examples: 'show me the data model', 'what tables are in this dataset?', 'get all measures and their DAX'
     """
     url = f"{FABRIC_API}/workspaces/{workspace_id}/semanticModels/{dataset_id}/getDefinition"
-    response = session.post(url)
+    response = await send("POST", url)
     
     if response.status_code == 202:
         location_header = response.headers.get('Location')
         if location_header:
-            result = wait_for_operation(location_header, 
-                                      int(response.headers.get('Retry-After', 30)))
+            try:
+                retry_after = float(response.headers.get('Retry-After', 30))
+            except ValueError:
+                retry_after = 30
+            result = await wait_for_operation(location_header, retry_after)
         else:
             return "Error: No Location header in 202 response"
-    elif response.ok:
-        result = response.json()
+    elif response.is_success:
+        result = orjson.loads(response.content)
     else:
         return f"Error: HTTP {response.status_code}"
     
@@ -172,12 +115,20 @@ def get_model_definition(workspace_id: str, dataset_id: str, file_filter: Option
     if not all_parts:
         return "No model definition found"
     
-    # Filter to only TMDL files
-    tmdl_parts = [p for p in all_parts if p.get("path", "").endswith('.tmdl')]
+    # Filter to TMDL files matching file_filter in a single pass, keeping (path, payload) tuples;
+    # payloads are not kept at all when only the file list is requested
+    ff = file_filter.casefold() if file_filter else None
+    tmdl_parts = []
+    for p in all_parts:
+        path = p.get("path", "")
+        if not path.endswith('.tmdl'):
+            continue
+        if ff and ff not in path.casefold():
+            continue
+        tmdl_parts.append((path, "" if metadata_only else p.get("payload", "")))
     
-    # Apply file filter if specified
-    if file_filter:
-        tmdl_parts = [p for p in tmdl_parts if file_filter.lower() in p.get("path", "").lower()]
+    # Release the raw response so its base64 payloads can be reclaimed before rendering
+    del result, all_parts
     
     total_parts = len(tmdl_parts)
     
@@ -210,44 +161,52 @@ def get_model_definition(workspace_id: str, dataset_id: str, file_filter: Option
     # Get parts for current range
     page_parts = tmdl_parts[start_idx:end_idx]
     
-    output = [
-        f"Dataset Model Definition (TMDL Format)\n",
-        f"{'='*40}\n",
-    ]
+    # Accumulate UTF-8 bytes in one contiguous buffer; decoded TMDL payloads are
+    # appended as raw bytes without a decode/re-encode round trip
+    buf = bytearray()
+    w = buf.extend
+    w(HEADER)
     
     if file_range:
-        output.append(f"File range: {file_range} | Total files: {total_parts}\n")
+        w(f"File range: {file_range} | Total files: {total_parts}\n".encode())
     else:
         # page is guaranteed to be int here (set to 1 if was None)
         current_page = page if page is not None else 1
-        output.append(f"Page {current_page} of {total_pages} | Total files: {total_parts}\n")
-        output.append(f"Page size: {page_size}\n")
+        w(f"Page {current_page} of {total_pages} | Total files: {total_parts}\n".encode())
+        w(f"Page size: {page_size}\n".encode())
     
-    output.append(f"Filter: {file_filter or 'None'}\n")
-    output.append(f"{'='*40}\n")
+    w(f"Filter: {file_filter or 'None'}\n{SEP_EQ}\n".encode())
     
     if metadata_only:
-        output.append("\nAvailable files:\n")
-        for i, part in enumerate(tmdl_parts):
-            marker = "→" if start_idx <= i < end_idx else " "
-            output.append(f"{marker} {i+1}. {part['path']}\n")
+        w(b"\nAvailable files:\n")
+        # Render before / inside / after the selected range separately so no bounds check runs per item
+        lo = min(max(start_idx, 0), total_parts)
+        hi = max(lo, end_idx)
+        for i, (path, _) in enumerate(tmdl_parts[:lo], 1):
+            w(f"  {i}. {path}\n".encode())
+        for i, (path, _) in enumerate(tmdl_parts[lo:hi], lo + 1):
+            w(f"→ {i}. {path}\n".encode())
+        for i, (path, _) in enumerate(tmdl_parts[hi:], hi + 1):
+            w(f"  {i}. {path}\n".encode())
     else:
-        for part in page_parts:
+        # Only the current page is rendered; drop the remaining payloads before decoding
+        del tmdl_parts
+        for i, (path, payload) in enumerate(page_parts, 1):
+            # Tool results are returned in one piece, so report per-file progress instead
+            await ctx.report_progress(i, len(page_parts))
             try:
-                content = base64.b64decode(part.get("payload", "")).decode('utf-8')
-                output.extend([
-                    f"\n{'─'*40}\n",
-                    f"File: {part['path']}\n",
-                    f"{'─'*40}\n",
-                    content,
-                    "\n"
-                ])
-            except Exception as e:
-                output.append(f"\nError decoding {part.get('path', 'unknown')}: {str(e)}\n")
+                content = a2b_base64(payload)
+                # Validate only; the bytes are kept so they are not re-encoded
+                content.decode()
+            except (binascii.Error, ValueError) as e:
+                w(f"\nError decoding {path}: {str(e)}\n".encode())
+                continue
+            w(f"\n{SEP_DASH}\nFile: {path}\n{SEP_DASH}\n".encode())
+            w(content)
+            w(b"\n")
     
     # Add navigation hints
-    output.append(f"\n{'─'*40}\n")
-    output.append("Navigation:\n")
+    w(NAVIGATION_HEADER)
     
     if file_range:
         # For file range navigation
@@ -255,38 +214,42 @@ def get_model_definition(workspace_id: str, dataset_id: str, file_filter: Option
         if current_end < total_parts:
             next_start = current_end + 1
             next_end = min(current_end + (end_idx - start_idx), total_parts)
-            output.append(f"→ Next range: Use file_range='{next_start}-{next_end}'\n")
+            w(f"→ Next range: Use file_range='{next_start}-{next_end}'\n".encode())
         
         if start_idx > 0:
             prev_size = end_idx - start_idx
             prev_start = max(1, start_idx - prev_size + 1)
             prev_end = start_idx
-            output.append(f"← Previous range: Use file_range='{prev_start}-{prev_end}'\n")
+            w(f"← Previous range: Use file_range='{prev_start}-{prev_end}'\n".encode())
         
-        output.append(f"\nSuggested ranges for complete retrieval:\n")
+        w(b"\nSuggested ranges for complete retrieval:\n")
         range_size = 10
-        for i in range(0, total_parts, range_size):
-            range_start = i + 1
-            range_end = min(i + range_size, total_parts)
-            output.append(f"  file_range='{range_start}-{range_end}'\n")
+        ranges = [f"  file_range='{i+1}-{min(i + range_size, total_parts)}'"
+                  for i in range(0, total_parts, range_size)]
+        # Only the first and last few hints are useful; elide the middle for large models
+        if len(ranges) > 10:
+            ranges = ranges[:5] + ["  ..."] + ranges[-5:]
+        if ranges:
+            w(('\n'.join(ranges) + '\n').encode())
     else:
         # For page-based navigation
         # At this point, page is guaranteed to be an int (set to 1 if it was None)
         if total_pages > 1 and page is not None:
             if page > 1:
-                output.append(f"← Previous page: Use page={page-1}\n")
+                w(f"← Previous page: Use page={page-1}\n".encode())
             if page < total_pages:
-                output.append(f"→ Next page: Use page={page+1}\n")
-            output.append(f"\nTo jump to a specific page, use page=N (1 to {total_pages})\n")
+                w(f"→ Next page: Use page={page+1}\n".encode())
+            w(f"\nTo jump to a specific page, use page=N (1 to {total_pages})\n".encode())
     
-    output.append("\nTo see only file list, use metadata_only=True\n")
-    output.append("To filter files, use file_filter='search_term'\n")
+    w(b"\nTo see only file list, use metadata_only=True\n")
+    w(b"To filter files, use file_filter='search_term'\n")
     
-    return ''.join(output)
+    # Single decode at the end; every payload in the buffer was validated as UTF-8 above
+    return buf.decode()
 
 
 @mcp.tool()
-def execute_dax_query(workspace_id: str, dataset_id: str, query: str) -> str:
+async def execute_dax_query(workspace_id: str, dataset_id: str, query: str) -> str:
     """
     Execute a DAX query against a Power BI dataset.
     Returns query results as JSON data.
@@ -299,15 +262,16 @@ def execute_dax_query(workspace_id: str, dataset_id: str, query: str) -> str:
         "EVALUATE SUMMARIZECOLUMNS('Date'[Year], 'Date'[Month], "@Revenue", SUM('Sales'[Revenue]), "@Profit", SUM('Sales'[Profit]))", 
         "EVALUATE SUMMARIZECOLUMNS('Customer'[Country], "@CustomerCount", COUNTROWS('Customer'))"
     """
-    url = f"{POWERBI_API}/groups/{workspace_id}/datasets/{dataset_id}/executeQueries"
-    result = make_request(url, method="POST", data={"queries": [{"query": query}]})
-    
-    if "error" in result:
-        return f"Error: {result['error']}"
-    
-    # Return the actual data
-    results = result.get("results", [])
-    return json.dumps(results[0]["tables"], indent=2) if results and "tables" in results[0] else "No data returned"
+    # Identical queries already running attach to the same future; the entry is
+    # removed as soon as the query finishes, so later calls always re-execute
+    key = (workspace_id, dataset_id, hashlib.blake2b(query.encode(), digest_size=16).hexdigest())
+    future = _inflight_dax.get(key)
+    if future is None:
+        url = f"{POWERBI_API}/groups/{workspace_id}/datasets/{dataset_id}/executeQueries"
+        future = asyncio.ensure_future(run_dax_query(url, query))
+        _inflight_dax[key] = future
+        future.add_done_callback(lambda _: _inflight_dax.pop(key, None))
+    return await asyncio.shield(future)
 #endregion
 
 
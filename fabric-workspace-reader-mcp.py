@@ -10,13 +10,10 @@ Example prompts to test this server:
 """
 
 #region Imports
-import subprocess
-import json
-import os
-import requests
-import keyring
+import asyncio
 from fastmcp import FastMCP
-from typing import Optional, List, Dict, Any
+from typing import Dict, Any, Callable
+from powerbi_client import POWERBI_API, make_select_request
 #endregion
 
 
@@ -24,82 +21,63 @@ from typing import Optional, List, Dict, Any
 # Create server
 mcp = FastMCP("fabric-workspace-reader")
 
-# API endpoint constants
-POWERBI_API = "https://api.powerbi.com/v1.0/myorg"
+# Output separators, built once
+SEP_EQ = '=' * 60
+SEP_HYPHEN = '-' * 60
+
+# Fields read by the formatters; requested via $select to shrink list payloads
+WORKSPACE_FIELDS = ("id", "name", "type", "state")
+DATASET_FIELDS = ("id", "name", "configuredBy", "isRefreshable")
+REPORT_FIELDS = ("id", "name", "datasetId", "webUrl")
+DASHBOARD_FIELDS = ("id", "displayName", "webUrl")
+DATAFLOW_FIELDS = ("objectId", "name", "description")
 #endregion
 
 
 #region Helper Functions
-# Authentication function
-def get_access_token() -> str:
-    """Get access token in 1 of 3 different methods."""
-    # 1. First try to get token from environment variable
-    token = os.environ.get("POWERBI_TOKEN", "")
-    if token:
-        return token
-
-    # 2. Try Azure CLI
-    try:
-        import platform
-        
-        # Use shell=True on Windows to ensure az.cmd is found
-        use_shell = platform.system() == "Windows"
-        
-        result = subprocess.run(
-            ["az", "account", "get-access-token", "--resource", "https://analysis.windows.net/powerbi/api"],
-            capture_output=True, 
-            text=True, 
-            check=True,
-            shell=use_shell
-        )
-        token_data = json.loads(result.stdout)
-        return token_data.get("accessToken", "")
-    except subprocess.CalledProcessError as e:
-        print(f"Azure CLI error: {e.stderr}")
-    except Exception as e:
-        print(f"Azure CLI auth failed: {str(e)}")
-
-    # 3. Try keyring as fallback
-    try:
-        return keyring.get_password("powerbi", "token") or ""
-    except Exception:
-        return ""
-
-# Get token
-TOKEN = get_access_token()
-
-if not TOKEN:
-    print("WARNING: No authentication token found. Please authenticate using one of these methods:")
-    print("1. Set POWERBI_TOKEN environment variable")
-    print("2. Run 'az login' (Azure CLI)")
-    print("3. Use 'keyring set powerbi token' to store token")
-
-# Create session with default headers
-session = requests.Session()
-session.headers.update({
-    "Authorization": f"Bearer {TOKEN}",
-    "Content-Type": "application/json"
-})
-
-
-# Function to make API requests with error handling
-def make_request(url: str, method: str = "GET", data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-    """
-    Makes an HTTP request to the specified URL.
-    Supports GET and POST methods with JSON data.
-    Returns JSON response or error message.
-    """
-    try:
-        response = session.request(method, url, json=data)
-        return response.json() if response.ok else {"error": f"HTTP {response.status_code}: {response.text[:200]}"}
-    except Exception as e:
-        return {"error": str(e)}
+# Response formatters: each item renders as a single f-string
+def _format_dataset(ds: Dict[str, Any]) -> str:
+    refreshable = "  Refreshable: Yes\n" if ds.get('isRefreshable') else ""
+    return (f"• {ds.get('name', 'Unknown')}\n"
+            f"  ID: {ds.get('id', 'Unknown')}\n"
+            f"  Configured By: {ds.get('configuredBy', 'Unknown')}\n"
+            f"{refreshable}\n")
+
+
+def _format_report(rpt: Dict[str, Any]) -> str:
+    dataset = f"  Dataset ID: {rpt['datasetId']}\n" if rpt.get('datasetId') else ""
+    return (f"• {rpt.get('name', 'Unknown')}\n"
+            f"  ID: {rpt.get('id', 'Unknown')}\n"
+            f"{dataset}"
+            f"  Web URL: {rpt.get('webUrl', 'N/A')}\n\n")
+
+
+def _format_dashboard(db: Dict[str, Any]) -> str:
+    return (f"• {db.get('displayName', 'Unknown')}\n"
+            f"  ID: {db.get('id', 'Unknown')}\n"
+            f"  Web URL: {db.get('webUrl', 'N/A')}\n\n")
+
+
+def _format_dataflow(df: Dict[str, Any]) -> str:
+    description = f"  Description: {df['description']}\n" if df.get('description') else ""
+    return (f"• {df.get('name', 'Unknown')}\n"
+            f"  ID: {df.get('objectId', 'Unknown')}\n"
+            f"{description}\n")
+
+
+def _format_section(title: str, result: Dict[str, Any], format_item: Callable[[Dict[str, Any]], str]) -> str:
+    """Renders one workspace item section (header + items) or its error line."""
+    if "error" in result:
+        return f"{title}: Error - {result['error']}\n\n"
+    items = result.get("value", [])
+    body = ''.join([format_item(item) for item in items])
+    return f"{title} ({len(items)}):\n{SEP_HYPHEN}\n{body}"
 #endregion
 
 
 #region MCP Tools
 @mcp.tool()
-def list_workspaces() -> str:
+async def list_workspaces() -> str:
     """
     List all accessible Microsoft Fabric workspaces.
     
@@ -107,7 +85,7 @@ def list_workspaces() -> str:
     Examples: 'list all my workspaces', 'show me my workspaces', 'what workspaces do I have access to?'
     """
     url = f"{POWERBI_API}/groups"
-    result = make_request(url)
+    result = await make_select_request(url, WORKSPACE_FIELDS)
     
     if "error" in result:
         return f"Error: {result['error']}"
@@ -117,20 +95,18 @@ def list_workspaces() -> str:
     if not workspaces:
         return "No workspaces found. Please verify your authentication and permissions."
     
-    output = [f"Found {len(workspaces)} workspaces:\n\n"]
-    
-    for ws in workspaces:
-        output.append(f"• {ws.get('name', 'Unknown')}\n")
-        output.append(f"  ID: {ws.get('id', 'Unknown')}\n")
-        output.append(f"  Type: {ws.get('type', 'Unknown')}\n")
-        output.append(f"  State: {ws.get('state', 'Unknown')}\n")
-        output.append("\n")
-    
-    return ''.join(output)
+    body = ''.join([
+        f"• {ws.get('name', 'Unknown')}\n"
+        f"  ID: {ws.get('id', 'Unknown')}\n"
+        f"  Type: {ws.get('type', 'Unknown')}\n"
+        f"  State: {ws.get('state', 'Unknown')}\n\n"
+        for ws in workspaces
+    ])
+    return f"Found {len(workspaces)} workspaces:\n\n{body}"
 
 
 @mcp.tool()
-def get_workspace_contents(workspace_id: str) -> str:
+async def get_workspace_contents(workspace_id: str) -> str:
     """
     Get detailed information about items in a specific workspace.
     
@@ -140,83 +116,24 @@ def get_workspace_contents(workspace_id: str) -> str:
     Returns information about all items (datasets, reports, dashboards, dataflows) in the workspace.
     Examples: 'show me what's in this workspace', 'list all datasets in workspace X', 'what's in this workspace?'
     """
-    # Get datasets
     datasets_url = f"{POWERBI_API}/groups/{workspace_id}/datasets"
-    datasets_result = make_request(datasets_url)
-    
-    # Get reports
     reports_url = f"{POWERBI_API}/groups/{workspace_id}/reports"
-    reports_result = make_request(reports_url)
-    
-    # Get dashboards
     dashboards_url = f"{POWERBI_API}/groups/{workspace_id}/dashboards"
-    dashboards_result = make_request(dashboards_url)
-    
-    # Get dataflows
     dataflows_url = f"{POWERBI_API}/groups/{workspace_id}/dataflows"
-    dataflows_result = make_request(dataflows_url)
-    
-    output = [f"Workspace Contents (ID: {workspace_id})\n"]
-    output.append(f"{'='*60}\n\n")
-    
-    # Datasets
-    if "error" not in datasets_result:
-        datasets = datasets_result.get("value", [])
-        output.append(f"DATASETS ({len(datasets)}):\n")
-        output.append("-" * 60 + "\n")
-        for ds in datasets:
-            output.append(f"• {ds.get('name', 'Unknown')}\n")
-            output.append(f"  ID: {ds.get('id', 'Unknown')}\n")
-            output.append(f"  Configured By: {ds.get('configuredBy', 'Unknown')}\n")
-            if ds.get('isRefreshable'):
-                output.append(f"  Refreshable: Yes\n")
-            output.append("\n")
-    else:
-        output.append(f"DATASETS: Error - {datasets_result['error']}\n\n")
-    
-    # Reports
-    if "error" not in reports_result:
-        reports = reports_result.get("value", [])
-        output.append(f"REPORTS ({len(reports)}):\n")
-        output.append("-" * 60 + "\n")
-        for rpt in reports:
-            output.append(f"• {rpt.get('name', 'Unknown')}\n")
-            output.append(f"  ID: {rpt.get('id', 'Unknown')}\n")
-            if rpt.get('datasetId'):
-                output.append(f"  Dataset ID: {rpt.get('datasetId')}\n")
-            output.append(f"  Web URL: {rpt.get('webUrl', 'N/A')}\n")
-            output.append("\n")
-    else:
-        output.append(f"REPORTS: Error - {reports_result['error']}\n\n")
-    
-    # Dashboards
-    if "error" not in dashboards_result:
-        dashboards = dashboards_result.get("value", [])
-        output.append(f"DASHBOARDS ({len(dashboards)}):\n")
-        output.append("-" * 60 + "\n")
-        for db in dashboards:
-            output.append(f"• {db.get('displayName', 'Unknown')}\n")
-            output.append(f"  ID: {db.get('id', 'Unknown')}\n")
-            output.append(f"  Web URL: {db.get('webUrl', 'N/A')}\n")
-            output.append("\n")
-    else:
-        output.append(f"DASHBOARDS: Error - {dashboards_result['error']}\n\n")
-    
-    # Dataflows
-    if "error" not in dataflows_result:
-        dataflows = dataflows_result.get("value", [])
-        output.append(f"DATAFLOWS ({len(dataflows)}):\n")
-        output.append("-" * 60 + "\n")
-        for df in dataflows:
-            output.append(f"• {df.get('name', 'Unknown')}\n")
-            output.append(f"  ID: {df.get('objectId', 'Unknown')}\n")
-            if df.get('description'):
-                output.append(f"  Description: {df.get('description')}\n")
-            output.append("\n")
-    else:
-        output.append(f"DATAFLOWS: Error - {dataflows_result['error']}\n\n")
     
-    return ''.join(output)
+    # Fetch datasets, reports, dashboards and dataflows concurrently
+    datasets_result, reports_result, dashboards_result, dataflows_result = await asyncio.gather(
+        make_select_request(datasets_url, DATASET_FIELDS),
+        make_select_request(reports_url, REPORT_FIELDS),
+        make_select_request(dashboards_url, DASHBOARD_FIELDS),
+        make_select_request(dataflows_url, DATAFLOW_FIELDS)
+    )
+    
+    return (f"Workspace Contents (ID: {workspace_id})\n{SEP_EQ}\n\n"
+            f"{_format_section('DATASETS', datasets_result, _format_dataset)}"
+            f"{_format_section('REPORTS', reports_result, _format_report)}"
+            f"{_format_section('DASHBOARDS', dashboards_result, _format_dashboard)}"
+            f"{_format_section('DATAFLOWS', dataflows_result, _format_dataflow)}")
 #endregion
 
 
@@ -19,26 +19,206 @@ Based on: https://www.anthropic.com/engineering/effective-harnesses-for-long-run
 """
 
 import asyncio
+import heapq
 import json
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 import sys
 import os
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# orjson parses features.json considerably faster when installed
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
 
-# Load .env BEFORE importing SDK (critical for API key)
-from dotenv import load_dotenv
-env_path = Path(__file__).parent.parent / ".env"
-load_dotenv(env_path, override=True)
+# Add parent directory to path for imports (main.py has already done so)
+_ROOT_DIR = str(Path(__file__).parent.parent)
+if _ROOT_DIR not in sys.path:
+    sys.path.insert(0, _ROOT_DIR)
+
+# Load .env BEFORE importing SDK (critical for API key), once per process
+if not os.environ.get("_CODING_AGENT_ENV_LOADED"):
+    from dotenv import load_dotenv
+    load_dotenv(Path(_ROOT_DIR) / ".env", override=True)
+    os.environ["_CODING_AGENT_ENV_LOADED"] = "1"
 
-from claude_agent_sdk import query, ClaudeAgentOptions, AssistantMessage, ResultMessage
 from config.agent_config import AgentConfig, default_config
-from config.compatibility import CompatibilityManager
+from config.compatibility import CompatibilityManager, dependency_ids
 from config.integration_testing import IntegrationTestRunner
 
+# Initial size of the trailing block read from claude-progress.txt
+PROGRESS_TAIL_BYTES = 32768
+
+# Static body of the Coding Agent system prompt; only the project header and
+# compatibility context are filled in per session
+_SYSTEM_PROMPT_TEMPLATE = """You are the Coding Agent for a long-running project system.
+
+Your job is to implement features one at a time, following a strict session protocol.
+You are ONE SESSION in a long chain of sessions - maintain compatibility with past and future work.
+
+## Project Information
+- **Name**: {project_name}
+- **Project Path**: {project_path}
+- **Features**: {total} total, {completed} completed, {remaining} remaining
+- **Implementable Now**: {implementable} (others blocked by dependencies)
+{compat_context}
+
+## ENHANCED Session Protocol (MUST FOLLOW)
+
+### Phase 1: Pre-Implementation
+1. **Check Environment**
+   - Verify working directory is correct
+   - Ensure all required files exist
+
+2. **Review Progress**
+   - Read claude-progress.txt for context from previous sessions
+   - Check git log for recent changes
+   - Understand what was done before
+
+3. **Check Dependencies**
+   - Review the feature's dependencies (if any)
+   - Verify all required features are complete
+   - If blocked, select a different feature or document the blocker
+
+4. **Run Smoke Tests**
+   - Verify the project builds/runs
+   - Ensure existing functionality works
+
+### Phase 2: Implementation
+5. **Implement Feature**
+   - Work incrementally, committing often
+   - Write tests for new functionality
+   - Follow project coding standards
+   - **MAINTAIN INTERFACE COMPATIBILITY** with dependent features
+
+6. **Write Integration Tests**
+   - Create tests that verify this feature works with related features
+   - Test data flow between features
+   - Test error handling across feature boundaries
+
+### Phase 3: Verification
+7. **Run All Tests**
+   - Unit tests for the new feature
+   - Integration tests with related features
+   - Regression tests for dependent features
+
+8. **Verify Compatibility**
+   - Check that features depending on this one still work
+   - Verify shared interfaces are not broken
+   - Test error propagation
+
+### Phase 4: Completion
+9. **Update Status**
+   - Update features.json: set "passes": true
+   - Add session summary to claude-progress.txt
+   - Document any interface changes for future sessions
+
+10. **Commit with Context**
+    - Descriptive commit message
+    - Note which features this relates to
+    - Document any breaking changes
+
+## Critical Compatibility Rules
+
+1. **NEVER BREAK SHARED INTERFACES**
+   - If a feature uses a function/API, don't change its signature
+   - Add new parameters as optional with defaults
+   - If you must break an interface, update ALL dependent features
+
+2. **DEPENDENCY ORDER MATTERS**
+   - Don't implement feature F005 if it depends on incomplete F003
+   - Check the "dependencies" field in features.json
+   - If blocked, document it and work on something else
+
+3. **INTEGRATION TESTS ARE REQUIRED**
+   - After completing a feature, verify it works with related features
+   - Run regression tests for features that depend on this one
+
+4. **DOCUMENT INTERFACES**
+   - When creating a function/class that others will use, document it
+   - Include type hints and docstrings
+   - Note which features are expected to use it
+
+## Feature Format (Enhanced)
+
+Each feature in features.json has:
+- "id": Unique identifier
+- "category": Category (core, ui, api, testing, etc.)
+- "description": What the feature does
+- "steps": Verification steps
+- "priority": 1-5 (1 is highest)
+- "passes": Boolean (you set this to true when complete)
+- "dependencies": List of feature IDs this depends on (NEW)
+- "implements_interfaces": Interfaces this provides (NEW)
+- "uses_interfaces": Interfaces this consumes (NEW)
+
+## At Session End
+
+Before finishing, you MUST:
+1. Run integration tests for this feature
+2. Run regression tests for dependent features
+3. Ensure all changes are committed
+4. Update claude-progress.txt with:
+   - What you implemented
+   - Any interface changes
+   - Known compatibility issues
+   - Recommendations for next session
+5. Update features.json if you completed a feature
+"""
+
+
+def _priority(feature: Dict[str, Any]) -> int:
+    """Sort key for features (lower number = higher priority)."""
+    return feature.get('priority', 5)
+
+
+def _parse_features(path: Path) -> List[Dict[str, Any]]:
+    """Parse the feature list from features.json; accepts a bare list or {"features": [...]}."""
+    data = json_loads(path.read_bytes())
+    if isinstance(data, list):
+        return data
+    if isinstance(data, dict) and 'features' in data:
+        return data['features']
+    return []
+
+
+def _project_status(
+    project_name: str,
+    project_path: Path,
+    session_path: Path,
+    features: List[Dict[str, Any]],
+    incomplete: List[Dict[str, Any]]
+) -> dict:
+    """Build the get_status() dictionary from already-loaded features."""
+    completed = len(features) - len(incomplete)
+
+    # Get recent session files
+    try:
+        entries = os.scandir(session_path)
+    except FileNotFoundError:
+        sessions = []
+    else:
+        # Keep only the five newest names instead of sorting the whole history
+        with entries:
+            sessions = heapq.nlargest(5, (
+                entry.name for entry in entries
+                if entry.name.startswith("session_") and entry.name.endswith(".txt")
+            ))
+
+    return {
+        "project_name": project_name,
+        "project_path": str(project_path),
+        "exists": project_path.exists(),
+        "features_total": len(features),
+        "features_completed": completed,
+        "features_remaining": len(incomplete),
+        "completion_percentage": round(completed / len(features) * 100, 1) if features else 0,
+        "next_feature": incomplete[0] if incomplete else None,
+        "recent_sessions": sessions
+    }
+
 
 class CodingAgent:
     """
@@ -80,47 +260,103 @@ class CodingAgent:
 
         # Compatibility systems
         self.compat_manager = CompatibilityManager(self.project_path)
-        self.test_runner = IntegrationTestRunner(self.project_path)
+        self.test_runner = IntegrationTestRunner(self.project_path, self.compat_manager)
+
+        # Parsed features.json, invalidated when (st_mtime_ns, st_size) changes
+        self._features_cache: Optional[List[Dict[str, Any]]] = None
+        self._features_stat: Optional[Tuple[int, int]] = None
+        self._incomplete_cache: Optional[List[Dict[str, Any]]] = None
+        self._dep_graph: Optional[Tuple[Dict[str, List[str]], Dict[str, bool]]] = None
+        self._any_incomplete = False
+
+        # Dependency validation results, reused within a single run()
+        self._validate_cache: Dict[str, Dict[str, Any]] = {}
 
     def _load_features(self) -> List[Dict[str, Any]]:
-        """Load features from features.json."""
-        if not self.features_path.exists():
-            return []
+        """
+        Load features from features.json.
 
-        with open(self.features_path, 'r') as f:
-            data = json.load(f)
-            if isinstance(data, list):
-                return data
-            elif isinstance(data, dict) and 'features' in data:
-                return data['features']
+        The parsed list is cached and only re-read when the file's
+        modification time or size changes, so repeated calls cost one stat.
+        """
+        try:
+            st = os.stat(self.features_path)
+        except FileNotFoundError:
+            self._features_cache = self._features_stat = None
+            self._incomplete_cache = self._dep_graph = None
+            self._any_incomplete = False
             return []
 
+        stat_key = (st.st_mtime_ns, st.st_size)
+        if stat_key == self._features_stat and self._features_cache is not None:
+            return self._features_cache
+
+        features = _parse_features(self.features_path)
+
+        self._features_cache = features
+        self._features_stat = stat_key
+        self._incomplete_cache = self._dep_graph = None
+        self._any_incomplete = any(not f.get('passes', False) for f in features)
+        return features
+
     def _get_incomplete_features(self) -> List[Dict[str, Any]]:
         """Get list of incomplete features, sorted by priority."""
         features = self._load_features()
-        incomplete = [f for f in features if not f.get('passes', False)]
-        # Sort by priority (lower number = higher priority)
-        incomplete.sort(key=lambda x: x.get('priority', 5))
-        return incomplete
+        if not self._any_incomplete:
+            return []
+        if self._incomplete_cache is None:
+            incomplete = [f for f in features if not f.get('passes', False)]
+            # Sort by priority (lower number = higher priority)
+            incomplete.sort(key=_priority)
+            self._incomplete_cache = incomplete
+        return list(self._incomplete_cache)
+
+    def _validate(self, feature_id: str) -> Dict[str, Any]:
+        """Validate a feature's dependency order, computing each feature at most once per run."""
+        validation = self._validate_cache.get(feature_id)
+        if validation is None:
+            validation = self.compat_manager.validate_dependency_order(feature_id)
+            self._validate_cache[feature_id] = validation
+        return validation
+
+    def _build_dep_graph(self) -> Tuple[Dict[str, List[str]], Dict[str, bool]]:
+        """
+        Build the dependency graph in one pass over the loaded features.
+
+        The graph is cached with the parsed features, so the per-feature
+        lookups run once per load rather than once per query.
+
+        Returns:
+            (adjacency: feature ID -> dependency IDs, status: feature ID -> passes)
+        """
+        features = self._load_features()
+        if self._dep_graph is None:
+            adj: Dict[str, List[str]] = {}
+            status: Dict[str, bool] = {}
+            for f in features:
+                fid = f.get('id')
+                adj[fid] = dependency_ids(f)
+                status[fid] = f.get('passes', False)
+            self._dep_graph = (adj, status)
+        return self._dep_graph
 
     def _get_implementable_features(self) -> List[Dict[str, Any]]:
         """
         Get features that can be implemented (all dependencies complete).
 
         This filters out features that are blocked by incomplete dependencies.
+        A dependency blocks only if it is a known feature that has not passed,
+        matching CompatibilityManager.validate_dependency_order.
         """
         incomplete = self._get_incomplete_features()
-        implementable = []
+        adj, status = self._build_dep_graph()
 
-        for feature in incomplete:
-            feature_id = feature.get('id')
-            validation = self.compat_manager.validate_dependency_order(feature_id)
-            if validation.get('can_implement', True):
-                implementable.append(feature)
-
-        return implementable
+        return [
+            f for f in incomplete
+            if all(status.get(dep, True) for dep in adj.get(f.get('id'), ()))
+        ]
 
-    def _run_pre_implementation_checks(self, feature_id: str) -> Dict[str, Any]:
+    async def _run_pre_implementation_checks(self, feature_id: str) -> Dict[str, Any]:
         """
         Run all pre-implementation compatibility checks.
 
@@ -135,12 +371,22 @@ class CodingAgent:
         """
         print("\n[Running Pre-Implementation Checks...]")
 
-        # 1. Get compatibility report
-        compat_report = self.compat_manager.generate_compatibility_report(feature_id)
+        # 1. Get compatibility report and 2. run smoke tests; they are
+        # independent, so run them concurrently in worker threads
+        compat_report, smoke_results = await asyncio.gather(
+            asyncio.to_thread(self.compat_manager.generate_compatibility_report, feature_id),
+            asyncio.to_thread(self.test_runner.run_smoke_tests)
+        )
 
-        # 2. Run smoke tests
-        smoke_results = self.test_runner.run_smoke_tests()
-        smoke_passed = all(r.passed for r in smoke_results)
+        # Summarize smoke results in one pass
+        smoke_passed = True
+        failed_tests = []
+        smoke_summary = []
+        for r in smoke_results:
+            smoke_summary.append({"name": r.test_name, "passed": r.passed})
+            if not r.passed:
+                smoke_passed = False
+                failed_tests.append(r.test_name)
 
         # 3. Analyze results
         warnings = []
@@ -162,7 +408,6 @@ class CodingAgent:
 
         # Check smoke tests
         if not smoke_passed:
-            failed_tests = [r.test_name for r in smoke_results if not r.passed]
             blockers.append(f"Smoke tests failed: {', '.join(failed_tests)}")
 
         # Add recommendations
@@ -177,14 +422,12 @@ class CodingAgent:
         return {
             "can_proceed": can_proceed,
             "compatibility_report": compat_report,
-            "smoke_test_results": [
-                {"name": r.test_name, "passed": r.passed} for r in smoke_results
-            ],
+            "smoke_test_results": smoke_summary,
             "warnings": warnings,
             "blockers": blockers
         }
 
-    def _run_post_implementation_tests(self, feature_id: str) -> Dict[str, Any]:
+    async def _run_post_implementation_tests(self, feature_id: str) -> Dict[str, Any]:
         """
         Run integration tests after implementing a feature.
 
@@ -192,180 +435,101 @@ class CodingAgent:
         """
         print("\n[Running Post-Implementation Tests...]")
 
-        # Run integration tests for this feature
-        int_results = self.test_runner.run_integration_tests(feature_ids=[feature_id])
-
-        # Run regression tests for dependent features
-        reg_results = self.test_runner.run_regression_tests(feature_id)
-
-        all_passed = (
-            all(r.passed for r in int_results) and
-            all(r.passed for r in reg_results)
+        # Run integration tests for this feature, then regression tests for
+        # dependent features. The runs share the project tree, .pytest_cache
+        # and result files, and each may start its own xdist workers, so they
+        # are not overlapped; the threads only keep the event loop free.
+        int_results = await asyncio.to_thread(
+            self.test_runner.run_integration_tests, feature_ids=[feature_id]
         )
+        reg_results = await asyncio.to_thread(self.test_runner.run_regression_tests, feature_id)
+
+        # Serialize both result sets and compute the aggregate in one pass each
+        all_passed = True
+        integration_tests = []
+        regression_tests = []
+        for results, summary in ((int_results, integration_tests), (reg_results, regression_tests)):
+            for r in results:
+                summary.append({"name": r.test_name, "passed": r.passed, "error": r.error_message})
+                if not r.passed:
+                    all_passed = False
 
         return {
             "all_passed": all_passed,
-            "integration_tests": [
-                {"name": r.test_name, "passed": r.passed, "error": r.error_message}
-                for r in int_results
-            ],
-            "regression_tests": [
-                {"name": r.test_name, "passed": r.passed, "error": r.error_message}
-                for r in reg_results
-            ]
+            "integration_tests": integration_tests,
+            "regression_tests": regression_tests
         }
 
     def _get_progress_summary(self) -> str:
-        """Read and summarize the progress file."""
-        if not self.progress_path.exists():
+        """
+        Read and summarize the progress file.
+
+        Only a trailing block of the file is read; the block doubles until it
+        holds the last 50 complete lines or covers the whole file.
+        """
+        try:
+            f = open(self.progress_path, 'rb')
+        except FileNotFoundError:
             return "No progress file found."
 
-        with open(self.progress_path, 'r') as f:
-            content = f.read()
+        with f:
+            size = f.seek(0, os.SEEK_END)
+            block = PROGRESS_TAIL_BYTES
+            while True:
+                start = max(0, size - block)
+                f.seek(start)
+                tail = f.read()
+                if start == 0 or tail.count(b'\n') >= 50:
+                    break
+                block *= 2
+
+        content = tail.decode('utf-8', errors='replace').replace('\r\n', '\n')
 
         # Return last 50 lines or full content if shorter
         lines = content.split('\n')
-        if len(lines) > 50:
+        if start > 0 or len(lines) > 50:
             return f"... (showing last 50 lines)\n" + '\n'.join(lines[-50:])
         return content
 
-    def _build_system_prompt(self, pre_check_results: Dict[str, Any] = None) -> str:
-        """Build the system prompt for the Coding Agent."""
-        features = self._load_features()
-        incomplete = self._get_incomplete_features()
-        implementable = self._get_implementable_features()
+    def _build_system_prompt(
+        self,
+        features: List[Dict[str, Any]],
+        incomplete: List[Dict[str, Any]],
+        implementable: List[Dict[str, Any]],
+        pre_check_results: Dict[str, Any] = None
+    ) -> str:
+        """
+        Build the system prompt for the Coding Agent.
+
+        Takes the feature lists run() already computed rather than reloading them.
+        """
         completed = len(features) - len(incomplete)
 
         # Build compatibility context
-        compat_context = ""
+        compat_lines = []
         if pre_check_results:
             warnings = pre_check_results.get("warnings", [])
             if warnings:
-                compat_context += "\n## Compatibility Warnings\n"
-                for w in warnings:
-                    compat_context += f"- {w}\n"
+                compat_lines.append("\n## Compatibility Warnings")
+                compat_lines.extend(f"- {w}" for w in warnings)
 
             compat_report = pre_check_results.get("compatibility_report", {})
             dependents = compat_report.get("dependents", [])
             if dependents:
-                compat_context += f"\n## Dependent Features (may be affected by changes)\n"
-                compat_context += f"These features depend on this one: {', '.join(dependents)}\n"
-                compat_context += "Be careful not to break their expected interfaces!\n"
-
-        return f"""You are the Coding Agent for a long-running project system.
-
-Your job is to implement features one at a time, following a strict session protocol.
-You are ONE SESSION in a long chain of sessions - maintain compatibility with past and future work.
-
-## Project Information
-- **Name**: {self.project_name}
-- **Project Path**: {self.project_path}
-- **Features**: {len(features)} total, {completed} completed, {len(incomplete)} remaining
-- **Implementable Now**: {len(implementable)} (others blocked by dependencies)
-{compat_context}
-
-## ENHANCED Session Protocol (MUST FOLLOW)
-
-### Phase 1: Pre-Implementation
-1. **Check Environment**
-   - Verify working directory is correct
-   - Ensure all required files exist
-
-2. **Review Progress**
-   - Read claude-progress.txt for context from previous sessions
-   - Check git log for recent changes
-   - Understand what was done before
-
-3. **Check Dependencies**
-   - Review the feature's dependencies (if any)
-   - Verify all required features are complete
-   - If blocked, select a different feature or document the blocker
-
-4. **Run Smoke Tests**
-   - Verify the project builds/runs
-   - Ensure existing functionality works
-
-### Phase 2: Implementation
-5. **Implement Feature**
-   - Work incrementally, committing often
-   - Write tests for new functionality
-   - Follow project coding standards
-   - **MAINTAIN INTERFACE COMPATIBILITY** with dependent features
-
-6. **Write Integration Tests**
-   - Create tests that verify this feature works with related features
-   - Test data flow between features
-   - Test error handling across feature boundaries
-
-### Phase 3: Verification
-7. **Run All Tests**
-   - Unit tests for the new feature
-   - Integration tests with related features
-   - Regression tests for dependent features
-
-8. **Verify Compatibility**
-   - Check that features depending on this one still work
-   - Verify shared interfaces are not broken
-   - Test error propagation
-
-### Phase 4: Completion
-9. **Update Status**
-   - Update features.json: set "passes": true
-   - Add session summary to claude-progress.txt
-   - Document any interface changes for future sessions
-
-10. **Commit with Context**
-    - Descriptive commit message
-    - Note which features this relates to
-    - Document any breaking changes
-
-## Critical Compatibility Rules
-
-1. **NEVER BREAK SHARED INTERFACES**
-   - If a feature uses a function/API, don't change its signature
-   - Add new parameters as optional with defaults
-   - If you must break an interface, update ALL dependent features
-
-2. **DEPENDENCY ORDER MATTERS**
-   - Don't implement feature F005 if it depends on incomplete F003
-   - Check the "dependencies" field in features.json
-   - If blocked, document it and work on something else
-
-3. **INTEGRATION TESTS ARE REQUIRED**
-   - After completing a feature, verify it works with related features
-   - Run regression tests for features that depend on this one
-
-4. **DOCUMENT INTERFACES**
-   - When creating a function/class that others will use, document it
-   - Include type hints and docstrings
-   - Note which features are expected to use it
-
-## Feature Format (Enhanced)
-
-Each feature in features.json has:
-- "id": Unique identifier
-- "category": Category (core, ui, api, testing, etc.)
-- "description": What the feature does
-- "steps": Verification steps
-- "priority": 1-5 (1 is highest)
-- "passes": Boolean (you set this to true when complete)
-- "dependencies": List of feature IDs this depends on (NEW)
-- "implements_interfaces": Interfaces this provides (NEW)
-- "uses_interfaces": Interfaces this consumes (NEW)
-
-## At Session End
-
-Before finishing, you MUST:
-1. Run integration tests for this feature
-2. Run regression tests for dependent features
-3. Ensure all changes are committed
-4. Update claude-progress.txt with:
-   - What you implemented
-   - Any interface changes
-   - Known compatibility issues
-   - Recommendations for next session
-5. Update features.json if you completed a feature
-"""
+                compat_lines.append("\n## Dependent Features (may be affected by changes)")
+                compat_lines.append(f"These features depend on this one: {', '.join(dependents)}")
+                compat_lines.append("Be careful not to break their expected interfaces!")
+        compat_context = "\n".join(compat_lines) + "\n" if compat_lines else ""
+
+        return _SYSTEM_PROMPT_TEMPLATE.format(
+            project_name=self.project_name,
+            project_path=self.project_path,
+            total=len(features),
+            completed=completed,
+            remaining=len(incomplete),
+            implementable=len(implementable),
+            compat_context=compat_context
+        )
 
     async def run(self, session_id: Optional[str] = None) -> dict:
         """
@@ -387,6 +551,9 @@ Before finishing, you MUST:
             print(f"Resuming session: {session_id}")
         print(f"{'='*60}\n")
 
+        # Dependency state may have changed since the last session
+        self._validate_cache.clear()
+
         # Validate project exists
         if not self.project_path.exists():
             return {
@@ -407,6 +574,7 @@ Before finishing, you MUST:
             }
 
         # Get incomplete features
+        features = self._load_features()
         incomplete = self._get_incomplete_features()
         if not incomplete:
             return {
@@ -421,7 +589,10 @@ Before finishing, you MUST:
         if not implementable:
             blocked_by = []
             for f in incomplete:
-                validation = self.compat_manager.validate_dependency_order(f.get('id'))
+                # A feature without dependencies cannot contribute a missing one
+                if not f.get('dependencies'):
+                    continue
+                validation = self._validate(f.get('id'))
                 if not validation.get('can_implement'):
                     blocked_by.extend(validation.get('missing_dependencies', []))
             return {
@@ -436,7 +607,7 @@ Before finishing, you MUST:
         feature_id = next_feature.get('id')
 
         # Run pre-implementation compatibility checks
-        pre_check_results = self._run_pre_implementation_checks(feature_id)
+        pre_check_results = await self._run_pre_implementation_checks(feature_id)
 
         if not pre_check_results.get("can_proceed"):
             blockers = pre_check_results.get("blockers", [])
@@ -455,20 +626,21 @@ Before finishing, you MUST:
         progress_summary = self._get_progress_summary()
 
         # Build compatibility context for prompt
-        compat_info = ""
+        compat_lines = []
         compat_report = pre_check_results.get("compatibility_report", {})
         deps = compat_report.get("dependencies", [])
         dependents = compat_report.get("dependents", [])
 
         if deps:
-            compat_info += f"\n## This Feature Depends On\n"
-            compat_info += f"Features: {', '.join(deps)}\n"
-            compat_info += "Review these implementations before starting.\n"
+            compat_lines.append("\n## This Feature Depends On")
+            compat_lines.append(f"Features: {', '.join(deps)}")
+            compat_lines.append("Review these implementations before starting.")
 
         if dependents:
-            compat_info += f"\n## Features That Will Use This\n"
-            compat_info += f"Features: {', '.join(dependents)}\n"
-            compat_info += "Design interfaces carefully - they cannot easily change later!\n"
+            compat_lines.append("\n## Features That Will Use This")
+            compat_lines.append(f"Features: {', '.join(dependents)}")
+            compat_lines.append("Design interfaces carefully - they cannot easily change later!")
+        compat_info = "\n".join(compat_lines) + "\n" if compat_lines else ""
 
         # Build the prompt
         prompt = f"""Start a new coding session for project "{self.project_name}".
@@ -506,6 +678,9 @@ Before finishing, you MUST:
 Begin by navigating to the project directory and understanding the current state.
 """
 
+        # The SDK is only needed to run a session; status queries skip its import cost
+        from claude_agent_sdk import query, ClaudeAgentOptions, AssistantMessage, ResultMessage
+
         new_session_id = None
         features_completed = []
         result_message = ""
@@ -515,7 +690,9 @@ Begin by navigating to the project directory and understanding the current state
             options = ClaudeAgentOptions(
                 allowed_tools=self.config.coding_tools,
                 permission_mode=self.config.permission_mode,
-                system_prompt=self._build_system_prompt(pre_check_results),
+                system_prompt=self._build_system_prompt(
+                    features, incomplete, implementable, pre_check_results
+                ),
                 cwd=str(self.project_path),
                 model=self.config.model
             )
@@ -526,20 +703,24 @@ Begin by navigating to the project directory and understanding the current state
 
             async for message in query(prompt=prompt, options=options):
                 # Capture session ID from init message
-                if hasattr(message, 'subtype') and message.subtype == 'init':
-                    if hasattr(message, 'session_id'):
-                        new_session_id = message.session_id
-                    elif hasattr(message, 'data') and isinstance(message.data, dict):
-                        new_session_id = message.data.get('session_id')
+                if getattr(message, 'subtype', None) == 'init':
+                    new_session_id = getattr(message, 'session_id', None)
+                    if new_session_id is None:
+                        data = getattr(message, 'data', None)
+                        if isinstance(data, dict):
+                            new_session_id = data.get('session_id')
                     print(f"[Session: {new_session_id}]")
 
                 # Print assistant messages
                 if isinstance(message, AssistantMessage):
                     for block in message.content:
-                        if hasattr(block, 'text'):
-                            print(block.text)
-                        elif hasattr(block, 'name'):
-                            print(f"\n[Tool: {block.name}]")
+                        text = getattr(block, 'text', None)
+                        if text is not None:
+                            print(text)
+                        else:
+                            name = getattr(block, 'name', None)
+                            if name is not None:
+                                print(f"\n[Tool: {name}]")
 
                 # Capture result
                 if isinstance(message, ResultMessage):
@@ -547,20 +728,26 @@ Begin by navigating to the project directory and understanding the current state
                     print(f"\n{result_message}")
 
             # Check which features are now complete
-            current_incomplete = self._get_incomplete_features()
-            for feature in incomplete:
-                if feature not in current_incomplete:
-                    features_completed.append(feature.get('id', 'unknown'))
+            still_incomplete = {f.get('id') for f in self._get_incomplete_features()}
+            features_completed = [
+                f.get('id', 'unknown') for f in incomplete
+                if f.get('id') not in still_incomplete
+            ]
 
             # Save session ID for future reference
             if new_session_id:
                 self.session_path.mkdir(parents=True, exist_ok=True)
-                session_file = self.session_path / f"session_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
-                with open(session_file, 'w') as f:
-                    f.write(f"Session ID: {new_session_id}\n")
-                    f.write(f"Started: {datetime.now().isoformat()}\n")
-                    f.write(f"Features Targeted: {next_feature.get('id', 'unknown')}\n")
-                    f.write(f"Features Completed: {', '.join(features_completed) or 'None'}\n")
+                now = datetime.now()
+                session_file = self.session_path / f"session_{now.strftime('%Y%m%d_%H%M%S')}.txt"
+                tmp_file = session_file.with_suffix('.tmp')
+                with open(tmp_file, 'w') as f:
+                    f.write(
+                        f"Session ID: {new_session_id}\n"
+                        f"Started: {now.isoformat()}\n"
+                        f"Features Targeted: {next_feature.get('id', 'unknown')}\n"
+                        f"Features Completed: {', '.join(features_completed) or 'None'}\n"
+                    )
+                os.replace(tmp_file, session_file)
 
             return {
                 "success": True,
@@ -581,31 +768,44 @@ Begin by navigating to the project directory and understanding the current state
         """
         Get the current status of the project.
 
+        Reads features through the same cache as run(), so calling this
+        before or after a session does not re-parse an unchanged features.json.
+
         Returns:
             Dictionary with project status information
         """
-        features = self._load_features()
-        incomplete = self._get_incomplete_features()
-        completed = len(features) - len(incomplete)
+        return _project_status(
+            self.project_name,
+            self.project_path,
+            self.session_path,
+            self._load_features(),
+            self._get_incomplete_features()
+        )
 
-        # Get recent session files
-        sessions = []
-        if self.session_path.exists():
-            session_files = sorted(self.session_path.glob("session_*.txt"), reverse=True)[:5]
-            for sf in session_files:
-                sessions.append(sf.name)
+    @classmethod
+    def load_status(cls, project_name: str, config: AgentConfig = default_config) -> dict:
+        """
+        Get a project's status without constructing an agent.
 
-        return {
-            "project_name": self.project_name,
-            "project_path": str(self.project_path),
-            "exists": self.project_path.exists(),
-            "features_total": len(features),
-            "features_completed": completed,
-            "features_remaining": len(incomplete),
-            "completion_percentage": round(completed / len(features) * 100, 1) if features else 0,
-            "next_feature": incomplete[0] if incomplete else None,
-            "recent_sessions": sessions
-        }
+        Reads only features.json and the sessions directory, so listing
+        many projects skips the per-agent compatibility and test setup.
+
+        Returns:
+            The same dictionary as get_status()
+        """
+        try:
+            features = _parse_features(config.get_features_path(project_name))
+        except FileNotFoundError:
+            features = []
+
+        incomplete = sorted((f for f in features if not f.get('passes', False)), key=_priority)
+        return _project_status(
+            project_name,
+            config.get_project_path(project_name),
+            config.get_session_path(project_name),
+            features,
+            incomplete
+        )
 
 
 async def main():
@@ -12,24 +12,58 @@ Based on: https://www.anthropic.com/engineering/effective-harnesses-for-long-run
 
 import asyncio
 import json
+import time
 from pathlib import Path
-from datetime import datetime
-from typing import Optional
+from typing import Optional, Dict, Tuple
 import sys
 import os
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# orjson parses JSON considerably faster when installed
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
 
-# Load .env BEFORE importing SDK (critical for API key)
-from dotenv import load_dotenv
-env_path = Path(__file__).parent.parent / ".env"
-load_dotenv(env_path, override=True)
+# Add parent directory to path for imports (main.py has already done so)
+_ROOT_DIR = str(Path(__file__).parent.parent)
+if _ROOT_DIR not in sys.path:
+    sys.path.insert(0, _ROOT_DIR)
+
+# Load .env BEFORE importing SDK (critical for API key), once per process;
+# shares the flag with coding_agent and main.py since it is the same file
+if not os.environ.get("_CODING_AGENT_ENV_LOADED"):
+    from dotenv import load_dotenv
+    load_dotenv(Path(_ROOT_DIR) / ".env", override=True)
+    os.environ["_CODING_AGENT_ENV_LOADED"] = "1"
 
-from claude_agent_sdk import query, ClaudeAgentOptions, AssistantMessage, ResultMessage
 from config.agent_config import AgentConfig, ProjectType, default_config
 
 
+# Rendered templates: path -> (st_mtime_ns, indented JSON text)
+_TEMPLATE_CACHE: Dict[Path, Tuple[int, str]] = {}
+
+
+def _load_template_text(path: Path) -> Optional[str]:
+    """
+    Get a feature template re-serialized as indented JSON, or None if it doesn't exist.
+
+    Templates rarely change, so the rendered text is reused until the file's
+    modification time does.
+    """
+    try:
+        mtime = path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+    cached = _TEMPLATE_CACHE.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    text = json.dumps(json_loads(path.read_bytes()), indent=2)
+    _TEMPLATE_CACHE[path] = (mtime, text)
+    return text
+
+
 class InitializerAgent:
     """
     Agent that runs once to set up project infrastructure.
@@ -74,8 +108,17 @@ class InitializerAgent:
         self.session_path = config.get_session_path(project_name)
         self.template_path = config.get_template_path(project_type)
 
+        # System prompt, built on first use; its inputs are fixed at construction
+        self._system_prompt: Optional[str] = None
+
     def _build_system_prompt(self) -> str:
-        """Build the system prompt for the Initializer Agent."""
+        """Build the system prompt for the Initializer Agent (cached after the first call)."""
+        if self._system_prompt is None:
+            self._system_prompt = self._render_system_prompt()
+        return self._system_prompt
+
+    def _render_system_prompt(self) -> str:
+        """Render the system prompt from the project settings."""
         return f"""You are the Initializer Agent for a long-running project system.
 
 Your job is to set up the foundational infrastructure for a new project.
@@ -146,6 +189,25 @@ After completing setup, summarize:
 - Next steps for the Coding Agent
 """
 
+    def _count_features(self) -> int:
+        """
+        Count the features in features.json, or 0 if it was not created.
+
+        The file is written by this session and read exactly once, so a single
+        C-level parse is cheaper than any incremental scan in Python.
+        """
+        try:
+            raw = self.features_path.read_bytes()
+        except FileNotFoundError:
+            return 0
+
+        features = json_loads(raw)
+        if isinstance(features, list):
+            return len(features)
+        if isinstance(features, dict) and 'features' in features:
+            return len(features['features'])
+        return 0
+
     async def run(self) -> dict:
         """
         Run the Initializer Agent to set up project infrastructure.
@@ -174,10 +236,9 @@ After completing setup, summarize:
 
         # Load template if available
         template_content = ""
-        if self.template_path.exists():
-            with open(self.template_path, 'r') as f:
-                template = json.load(f)
-                template_content = f"\n\nUse this template as a starting point:\n{json.dumps(template, indent=2)}"
+        template_text = _load_template_text(self.template_path)
+        if template_text is not None:
+            template_content = f"\n\nUse this template as a starting point:\n{template_text}"
 
         # Build the prompt
         prompt = f"""Initialize a new {self.project_type.value} project called "{self.project_name}".
@@ -196,6 +257,9 @@ Please:
 Start by creating the project directory, then proceed with each task.
 """
 
+        # The SDK is only needed to run a session; importing the package stays cheap
+        from claude_agent_sdk import query, ClaudeAgentOptions, AssistantMessage, ResultMessage
+
         session_id = None
         result_message = ""
         features_count = 0
@@ -233,21 +297,16 @@ Start by creating the project directory, then proceed with each task.
                     print(f"\n{result_message}")
 
             # Check if features.json was created and count features
-            if self.features_path.exists():
-                with open(self.features_path, 'r') as f:
-                    features = json.load(f)
-                    if isinstance(features, list):
-                        features_count = len(features)
-                    elif isinstance(features, dict) and 'features' in features:
-                        features_count = len(features['features'])
+            features_count = self._count_features()
 
             # Save session ID for future reference
             if session_id:
                 self.session_path.mkdir(parents=True, exist_ok=True)
                 session_file = self.session_path / "init_session.txt"
-                with open(session_file, 'w') as f:
-                    f.write(f"Session ID: {session_id}\n")
-                    f.write(f"Created: {datetime.now().isoformat()}\n")
+                session_file.write_text(
+                    f"Session ID: {session_id}\n"
+                    f"Created: {time.strftime('%Y-%m-%dT%H:%M:%S')}\n"
+                )
 
             return {
                 "success": True,
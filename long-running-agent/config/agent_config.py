@@ -11,7 +11,8 @@ This module defines:
 from enum import Enum
 from pathlib import Path
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import List, Optional, Tuple
+import functools
 import os
 from dotenv import load_dotenv
 
@@ -27,7 +28,64 @@ class ProjectType(Enum):
     GENERIC = "generic"
 
 
-@dataclass
+# Tools for Initializer Agent (runs once to set up project)
+# Needs: Read files, Write files, Execute commands, Search files
+INITIALIZER_TOOLS: Tuple[str, ...] = (
+    "Read",      # Read existing files to understand structure
+    "Write",     # Create feature lists, progress docs, init scripts
+    "Edit",      # Modify configuration files
+    "Bash",      # Run git init, create directories
+    "Glob",      # Find files by pattern
+    "Grep",      # Search file contents
+)
+
+# Tools for Coding Agent (runs in subsequent sessions)
+# Full toolkit for implementing features
+CODING_TOOLS: Tuple[str, ...] = (
+    "Read",      # Read code and progress files
+    "Write",     # Create new files
+    "Edit",      # Modify existing code
+    "Bash",      # Run tests, git commands
+    "Glob",      # Find files by pattern
+    "Grep",      # Search code
+    "WebSearch", # Research solutions
+    "WebFetch",  # Fetch documentation
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_api_key() -> Optional[str]:
+    """Read ANTHROPIC_API_KEY from the environment once per process."""
+    return os.getenv("ANTHROPIC_API_KEY")
+
+
+def invalidate_api_key_cache() -> None:
+    """Forget the cached API key, e.g. after changing the environment in tests."""
+    _get_api_key.cache_clear()
+
+
+@dataclass(frozen=True, slots=True)
+class ProjectPaths:
+    """Filesystem locations for one managed project."""
+    project: Path
+    features: Path
+    progress: Path
+    sessions: Path
+
+
+@functools.cache
+def _project_paths(base_dir: Path, project_name: str) -> ProjectPaths:
+    """Build a project's paths once per (base_dir, project_name)."""
+    project = base_dir / "projects" / project_name
+    return ProjectPaths(
+        project=project,
+        features=project / "features.json",
+        progress=project / "claude-progress.txt",
+        sessions=project / ".sessions"
+    )
+
+
+@dataclass(slots=True)
 class AgentConfig:
     """
     Configuration settings for both Initializer and Coding agents.
@@ -57,29 +115,9 @@ class AgentConfig:
     # Model configuration
     model: str = "claude-sonnet-4-5"
 
-    # Tools for Initializer Agent (runs once to set up project)
-    # Needs: Read files, Write files, Execute commands, Search files
-    initializer_tools: List[str] = field(default_factory=lambda: [
-        "Read",      # Read existing files to understand structure
-        "Write",     # Create feature lists, progress docs, init scripts
-        "Edit",      # Modify configuration files
-        "Bash",      # Run git init, create directories
-        "Glob",      # Find files by pattern
-        "Grep",      # Search file contents
-    ])
-
-    # Tools for Coding Agent (runs in subsequent sessions)
-    # Full toolkit for implementing features
-    coding_tools: List[str] = field(default_factory=lambda: [
-        "Read",      # Read code and progress files
-        "Write",     # Create new files
-        "Edit",      # Modify existing code
-        "Bash",      # Run tests, git commands
-        "Glob",      # Find files by pattern
-        "Grep",      # Search code
-        "WebSearch", # Research solutions
-        "WebFetch",  # Fetch documentation
-    ])
+    # Tool sets are immutable and shared by every instance
+    initializer_tools: Tuple[str, ...] = INITIALIZER_TOOLS
+    coding_tools: Tuple[str, ...] = CODING_TOOLS
 
     # Permission mode for agents
     # "acceptEdits" - auto-approve file edits, ask for other actions
@@ -88,7 +126,7 @@ class AgentConfig:
 
     def get_project_path(self, project_name: str) -> Path:
         """Get the full path for a project by name."""
-        return self.projects_dir / project_name
+        return _project_paths(self.base_dir, project_name).project
 
     def get_template_path(self, project_type: ProjectType) -> Path:
         """Get the template file path for a project type."""
@@ -96,25 +134,28 @@ class AgentConfig:
 
     def get_features_path(self, project_name: str) -> Path:
         """Get the features.json path for a project."""
-        return self.get_project_path(project_name) / "features.json"
+        return _project_paths(self.base_dir, project_name).features
 
     def get_progress_path(self, project_name: str) -> Path:
         """Get the claude-progress.txt path for a project."""
-        return self.get_project_path(project_name) / "claude-progress.txt"
+        return _project_paths(self.base_dir, project_name).progress
 
     def get_session_path(self, project_name: str) -> Path:
         """Get the session storage path for a project."""
-        return self.get_project_path(project_name) / ".sessions"
+        return _project_paths(self.base_dir, project_name).sessions
 
     @staticmethod
     def get_api_key() -> Optional[str]:
         """
         Get the Anthropic API key from environment.
 
+        The lookup is cached; call invalidate_api_key_cache() after changing
+        ANTHROPIC_API_KEY at runtime.
+
         Returns:
             API key string or None if not set
         """
-        return os.getenv("ANTHROPIC_API_KEY")
+        return _get_api_key()
 
     def validate(self) -> List[str]:
         """
@@ -15,11 +15,19 @@ Based on: https://www.anthropic.com/engineering/effective-harnesses-for-long-run
 """
 
 import json
+import os
+import threading
 from pathlib import Path
 from dataclasses import dataclass, field
-from typing import List, Dict, Any, Optional, Set
+from typing import List, Dict, Any, Optional, Set, Tuple, Callable
 from enum import Enum
 
+# orjson parses JSON considerably faster when installed
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
 
 class FeatureStatus(Enum):
     """Status of a feature in the development lifecycle."""
@@ -30,7 +38,7 @@ class FeatureStatus(Enum):
     NEEDS_UPDATE = "needs_update" # Dependency changed, needs review
 
 
-@dataclass
+@dataclass(slots=True)
 class FeatureDependency:
     """
     Represents a dependency between features.
@@ -45,7 +53,7 @@ class FeatureDependency:
     interface_contract: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class InterfaceContract:
     """
     Defines a shared interface that multiple features must follow.
@@ -71,7 +79,7 @@ class InterfaceContract:
     used_by: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class IntegrationTest:
     """
     Defines a test that verifies multiple features work together.
@@ -94,6 +102,20 @@ class IntegrationTest:
     last_result: Optional[str] = None
 
 
+def dependency_ids(feature: Dict[str, Any]) -> List[str]:
+    """
+    Get the IDs a feature depends on.
+
+    Dependencies may be plain ID strings or FeatureDependency-style dicts
+    with a "feature_id" key; both normalize to the ID.
+    """
+    return [d.get("feature_id") if isinstance(d, dict) else d for d in feature.get("dependencies", [])]
+
+
+# (lookup: ID -> feature, forward: ID -> dependency IDs, reverse: ID -> dependent IDs)
+FeatureIndex = Tuple[Dict[str, Dict[str, Any]], Dict[str, List[str]], Dict[str, List[str]]]
+
+
 class CompatibilityManager:
     """
     Manages feature compatibility across agent sessions.
@@ -112,28 +134,111 @@ class CompatibilityManager:
         self.contracts_path = project_path / "interface_contracts.json"
         self.integration_tests_path = project_path / "integration_tests.json"
 
+        # Parsed JSON files: path -> ((st_mtime_ns, st_size), parsed value)
+        self._cache: Dict[Path, Tuple[Tuple[int, int], Any]] = {}
+
+        # Guards the caches below; reports may be generated from worker threads
+        self._lock = threading.RLock()
+
+        # Feature index and the parsed features.json it was built from
+        self._feature_index: Optional[FeatureIndex] = None
+        self._indexed_features: Any = None
+
+        # Contracts per feature and the parsed contracts they were built from
+        self._contracts_by_feature: Dict[str, List[Tuple[str, bool]]] = {}
+        self._indexed_contracts: Any = None
+
+        # Integration tests per feature and the parsed tests they were built from
+        self._tests_by_feature: Dict[str, List[IntegrationTest]] = {}
+        self._indexed_tests: Any = None
+
+    def _load_cached(self, path: Path, parse: Callable[[Any], Any], default: Callable[[], Any]) -> Any:
+        """
+        Load and parse a JSON file, reusing the previous result while the
+        file's modification time and size are unchanged.
+
+        Callers must treat the returned value as read-only.
+        """
+        with self._lock:
+            try:
+                st = os.stat(path)
+            except FileNotFoundError:
+                self._cache.pop(path, None)
+                return default()
+
+            stat_key = (st.st_mtime_ns, st.st_size)
+            cached = self._cache.get(path)
+            if cached is not None and cached[0] == stat_key:
+                return cached[1]
+
+            value = parse(json_loads(path.read_bytes()))
+            self._cache[path] = (stat_key, value)
+            return value
+
+    def invalidate(self) -> None:
+        """Drop all cached files; call after writing them within the same timestamp tick."""
+        with self._lock:
+            self._cache.clear()
+            self._feature_index = self._indexed_features = None
+            self._contracts_by_feature = {}
+            self._indexed_contracts = None
+            self._tests_by_feature = {}
+            self._indexed_tests = None
+
     def load_features(self) -> Dict[str, Any]:
         """Load features from features.json."""
-        if not self.features_path.exists():
-            return {"features": []}
-        with open(self.features_path, 'r') as f:
-            return json.load(f)
+        return self._load_cached(self.features_path, lambda data: data, lambda: {"features": []})
 
     def load_contracts(self) -> Dict[str, InterfaceContract]:
         """Load interface contracts."""
-        if not self.contracts_path.exists():
-            return {}
-        with open(self.contracts_path, 'r') as f:
-            data = json.load(f)
-            return {k: InterfaceContract(**v) for k, v in data.items()}
+        return self._load_cached(
+            self.contracts_path,
+            lambda data: {k: InterfaceContract(**v) for k, v in data.items()},
+            dict
+        )
 
     def load_integration_tests(self) -> List[IntegrationTest]:
         """Load integration test definitions."""
-        if not self.integration_tests_path.exists():
-            return []
-        with open(self.integration_tests_path, 'r') as f:
-            data = json.load(f)
-            return [IntegrationTest(**t) for t in data]
+        return self._load_cached(
+            self.integration_tests_path,
+            lambda data: [IntegrationTest(**t) for t in data],
+            list
+        )
+
+    def _build_index(self, features: List[Dict[str, Any]]) -> FeatureIndex:
+        """
+        Build the lookups every dependency query needs in one pass over the features.
+
+        Returns:
+            (lookup: feature ID -> feature,
+             forward: feature ID -> dependency IDs,
+             reverse: feature ID -> IDs of features that depend on it)
+        """
+        lookup: Dict[str, Dict[str, Any]] = {}
+        forward: Dict[str, List[str]] = {}
+        reverse: Dict[str, List[str]] = {}
+        for f in features:
+            fid = f.get("id")
+            dep_ids = dependency_ids(f)
+            lookup[fid] = f
+            forward[fid] = dep_ids
+            for dep_id in dict.fromkeys(dep_ids):
+                reverse.setdefault(dep_id, []).append(fid)
+        return lookup, forward, reverse
+
+    def _index(self) -> FeatureIndex:
+        """
+        Get the feature index for the current features.json.
+
+        The index is rebuilt only when load_features() returns a newly parsed
+        document, so reverse-dependency lookups are O(1) between file changes.
+        """
+        with self._lock:
+            features_data = self.load_features()
+            if self._feature_index is None or features_data is not self._indexed_features:
+                self._feature_index = self._build_index(features_data.get("features", []))
+                self._indexed_features = features_data
+            return self._feature_index
 
     def get_feature_dependencies(self, feature_id: str) -> List[str]:
         """
@@ -141,25 +246,23 @@ class CompatibilityManager:
 
         Returns both direct and transitive dependencies.
         """
-        features_data = self.load_features()
-        features = features_data.get("features", [])
+        return self._feature_dependencies(feature_id, self._index())
 
-        # Build dependency graph
-        dep_graph = {}
-        for f in features:
-            fid = f.get("id")
-            deps = f.get("dependencies", [])
-            dep_graph[fid] = [d.get("feature_id") if isinstance(d, dict) else d for d in deps]
+    def _feature_dependencies(self, feature_id: str, index: FeatureIndex) -> List[str]:
+        """Transitive dependencies of a feature, using a prebuilt index."""
+        _, dep_graph, _ = index
 
-        # Find all dependencies (transitive closure)
+        # Find all dependencies (transitive closure); nodes already visited
+        # are never pushed, so diamond-shaped graphs don't grow the stack
         visited = set()
-        to_visit = dep_graph.get(feature_id, [])
+        stack = list(dep_graph.get(feature_id, ()))
 
-        while to_visit:
-            dep = to_visit.pop()
-            if dep not in visited:
-                visited.add(dep)
-                to_visit.extend(dep_graph.get(dep, []))
+        while stack:
+            dep = stack.pop()
+            if dep in visited:
+                continue
+            visited.add(dep)
+            stack.extend([d for d in dep_graph.get(dep, ()) if d not in visited])
 
         return list(visited)
 
@@ -169,17 +272,11 @@ class CompatibilityManager:
 
         This is crucial for knowing what might break if we change a feature.
         """
-        features_data = self.load_features()
-        features = features_data.get("features", [])
-
-        dependents = []
-        for f in features:
-            deps = f.get("dependencies", [])
-            dep_ids = [d.get("feature_id") if isinstance(d, dict) else d for d in deps]
-            if feature_id in dep_ids:
-                dependents.append(f.get("id"))
+        return self._dependent_features(feature_id, self._index())
 
-        return dependents
+    def _dependent_features(self, feature_id: str, index: FeatureIndex) -> List[str]:
+        """Direct dependents of a feature, using a prebuilt index."""
+        return list(index[2].get(feature_id, []))
 
     def validate_dependency_order(self, feature_id: str) -> Dict[str, Any]:
         """
@@ -192,24 +289,19 @@ class CompatibilityManager:
                 "blocked_by": list of features blocking this one
             }
         """
-        features_data = self.load_features()
-        features = features_data.get("features", [])
+        return self._validate_dependency_order(feature_id, self._index())
 
-        # Create a lookup
-        feature_lookup = {f.get("id"): f for f in features}
+    def _validate_dependency_order(self, feature_id: str, index: FeatureIndex) -> Dict[str, Any]:
+        """validate_dependency_order against a prebuilt index."""
+        feature_lookup, dep_graph, _ = index
 
         # Get target feature
-        target = feature_lookup.get(feature_id)
-        if not target:
+        if feature_id not in feature_lookup:
             return {"can_implement": False, "error": f"Feature {feature_id} not found"}
 
-        # Get dependencies
-        deps = target.get("dependencies", [])
-        dep_ids = [d.get("feature_id") if isinstance(d, dict) else d for d in deps]
-
         # Check which dependencies are incomplete
         missing = []
-        for dep_id in dep_ids:
+        for dep_id in dep_graph[feature_id]:
             dep_feature = feature_lookup.get(dep_id)
             if dep_feature and not dep_feature.get("passes", False):
                 missing.append(dep_id)
@@ -226,11 +318,38 @@ class CompatibilityManager:
 
         Returns compatibility issues if any.
         """
+        return self._check_interface_compatibility(feature_id, self._index())
+
+    def _contract_index(self, contracts: Dict[str, InterfaceContract]) -> Dict[str, List[Tuple[str, bool]]]:
+        """
+        Map each feature to the contracts it implements or uses.
+
+        Entries are (contract name, implements) in contract order; a feature
+        listed in both implemented_by and used_by counts as implementing.
+        Rebuilt only when load_contracts() returns a newly parsed file.
+        """
+        with self._lock:
+            if contracts is not self._indexed_contracts:
+                by_feature: Dict[str, List[Tuple[str, bool]]] = {}
+                for name, contract in contracts.items():
+                    implementers = set(contract.implemented_by)
+                    for fid in implementers:
+                        by_feature.setdefault(fid, []).append((name, True))
+                    for fid in set(contract.used_by) - implementers:
+                        by_feature.setdefault(fid, []).append((name, False))
+                self._contracts_by_feature = by_feature
+                self._indexed_contracts = contracts
+            return self._contracts_by_feature
+
+    def _check_interface_compatibility(self, feature_id: str, index: FeatureIndex) -> Dict[str, Any]:
+        """check_interface_compatibility against a prebuilt index."""
         contracts = self.load_contracts()
         issues = []
 
-        for name, contract in contracts.items():
-            if feature_id in contract.implemented_by:
+        # Only the contracts that mention this feature are visited
+        for name, implements in self._contract_index(contracts).get(feature_id, ()):
+            contract = contracts[name]
+            if implements:
                 # Feature implements this interface - check it provides all methods
                 issues.append({
                     "contract": name,
@@ -238,10 +357,10 @@ class CompatibilityManager:
                     "required_methods": contract.methods,
                     "required_structures": contract.data_structures
                 })
-            elif feature_id in contract.used_by:
+            else:
                 # Feature uses this interface - check dependency is complete
                 for implementer in contract.implemented_by:
-                    validation = self.validate_dependency_order(implementer)
+                    validation = self._validate_dependency_order(implementer, index)
                     if not validation.get("can_implement"):
                         issues.append({
                             "contract": name,
@@ -250,41 +369,72 @@ class CompatibilityManager:
                         })
 
         return {
-            "compatible": len([i for i in issues if i.get("type") == "dependency"]) == 0,
+            "compatible": not any(i.get("type") == "dependency" for i in issues),
             "contracts": issues
         }
 
     def get_integration_tests_for_feature(self, feature_id: str) -> List[IntegrationTest]:
         """Get all integration tests that involve a specific feature."""
         tests = self.load_integration_tests()
-        return [t for t in tests if feature_id in t.features_tested]
+        with self._lock:
+            if tests is not self._indexed_tests:
+                # Index each test under the distinct features it covers, in test order
+                by_feature: Dict[str, List[IntegrationTest]] = {}
+                for t in tests:
+                    for fid in set(t.features_tested):
+                        by_feature.setdefault(fid, []).append(t)
+                self._tests_by_feature = by_feature
+                self._indexed_tests = tests
+            return list(self._tests_by_feature.get(feature_id, ()))
+
+    def _report_context(self, feature_id: str, index: FeatureIndex) -> Dict[str, Any]:
+        """Compute the checks shared by the report and its recommendations."""
+        return {
+            "dependency_validation": self._validate_dependency_order(feature_id, index),
+            "interface_compatibility": self._check_interface_compatibility(feature_id, index),
+            "dependents": self._dependent_features(feature_id, index),
+            "integration_tests": self.get_integration_tests_for_feature(feature_id)
+        }
 
     def generate_compatibility_report(self, feature_id: str) -> Dict[str, Any]:
         """
         Generate a comprehensive compatibility report for a feature.
 
         This should be run BEFORE implementing any feature to understand
-        the compatibility landscape.
+        the compatibility landscape. The feature index is built once and
+        shared by every section of the report.
         """
+        index = self._index()
+        context = self._report_context(feature_id, index)
         return {
             "feature_id": feature_id,
-            "dependency_validation": self.validate_dependency_order(feature_id),
-            "interface_compatibility": self.check_interface_compatibility(feature_id),
-            "dependencies": self.get_feature_dependencies(feature_id),
-            "dependents": self.get_dependent_features(feature_id),
+            "dependency_validation": context["dependency_validation"],
+            "interface_compatibility": context["interface_compatibility"],
+            "dependencies": self._feature_dependencies(feature_id, index),
+            "dependents": context["dependents"],
             "integration_tests": [
                 {"id": t.id, "name": t.name, "features": t.features_tested}
-                for t in self.get_integration_tests_for_feature(feature_id)
+                for t in context["integration_tests"]
             ],
-            "recommendations": self._generate_recommendations(feature_id)
+            "recommendations": self._generate_recommendations(feature_id, context)
         }
 
-    def _generate_recommendations(self, feature_id: str) -> List[str]:
-        """Generate recommendations for implementing a feature safely."""
+    def _generate_recommendations(self, feature_id: str, context: Optional[Dict[str, Any]] = None) -> List[str]:
+        """
+        Generate recommendations for implementing a feature safely.
+
+        Args:
+            feature_id: Feature to generate recommendations for
+            context: Results already computed by generate_compatibility_report
+                (dependency_validation, interface_compatibility, dependents,
+                integration_tests); computed here when not provided
+        """
+        if context is None:
+            context = self._report_context(feature_id, self._index())
         recommendations = []
 
         # Check dependencies
-        dep_validation = self.validate_dependency_order(feature_id)
+        dep_validation = context["dependency_validation"]
         if not dep_validation.get("can_implement"):
             missing = dep_validation.get("missing_dependencies", [])
             recommendations.append(
@@ -292,7 +442,7 @@ class CompatibilityManager:
             )
 
         # Check dependents (what might break)
-        dependents = self.get_dependent_features(feature_id)
+        dependents = context["dependents"]
         if dependents:
             recommendations.append(
                 f"CAUTION: These features depend on this one: {', '.join(dependents)}. "
@@ -300,7 +450,7 @@ class CompatibilityManager:
             )
 
         # Check integration tests
-        tests = self.get_integration_tests_for_feature(feature_id)
+        tests = context["integration_tests"]
         if tests:
             recommendations.append(
                 f"Run these integration tests after implementation: "
@@ -312,7 +462,7 @@ class CompatibilityManager:
             )
 
         # Check interface contracts
-        interface_check = self.check_interface_compatibility(feature_id)
+        interface_check = context["interface_compatibility"]
         for contract in interface_check.get("contracts", []):
             if contract.get("type") == "implements":
                 recommendations.append(
@@ -16,14 +16,97 @@ The Session Protocol requires:
 - Run regression tests if modifying existing features
 """
 
+import asyncio
+import functools
+import heapq
 import json
+import os
+import shlex
+import signal
 import subprocess
+import threading
+import time
 from pathlib import Path
 from dataclasses import dataclass, field
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 from datetime import datetime
 from enum import Enum
 
+# orjson reads and writes result records considerably faster when installed
+try:
+    from orjson import dumps as _json_dumps, loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
+
+@functools.lru_cache(maxsize=8)
+def _xdist_available(cwd: str) -> bool:
+    """
+    Whether pytest-xdist is installed (pip install pytest-xdist) for the
+    `python` that runs the tests from cwd; checked once per project.
+
+    The project's environment can differ from the agent's, so this asks that
+    interpreter rather than looking in our own site-packages.
+    """
+    try:
+        probe = subprocess.run(
+            ["python", "-c", "import xdist"],
+            cwd=cwd,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            timeout=30
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return False
+    return probe.returncode == 0
+
+
+@functools.lru_cache(maxsize=64)
+def _build_marker(feature_ids: Tuple[str, ...]) -> str:
+    """pytest -m expression selecting the given features; regression sweeps repeat the same sets."""
+    # Duplicates (e.g. a feature listed as its own dependent) would only lengthen the expression
+    return " or ".join([f"feature_{fid}" for fid in dict.fromkeys(feature_ids)])
+
+
+# Characters that need a shell to interpret (pipes, redirects, globs, expansions, ...)
+_SHELL_SYNTAX = frozenset("|&;<>()$`\\*?[]{}~!#\n")
+
+
+def _command_argv(command: str, argv: Optional[List[str]] = None) -> Optional[List[str]]:
+    """
+    Argument vector for running a test command without a shell.
+
+    Uses the configured argv when present, else splits plain commands with
+    shlex. Returns None when the command relies on shell syntax (or sets
+    environment variables inline) and must still run through the shell.
+    """
+    if argv:
+        return list(argv)
+    if not _SHELL_SYNTAX.isdisjoint(command):
+        return None
+    try:
+        parts = shlex.split(command)
+    except ValueError:
+        # Unbalanced quotes: let the shell report the error as before
+        return None
+    if not parts or "=" in parts[0]:
+        return None
+    return parts
+
+
+def _kill_process_group(proc: Any) -> None:
+    """Kill a test process started with start_new_session, including its children."""
+    try:
+        if hasattr(os, "killpg"):
+            os.killpg(proc.pid, signal.SIGKILL)
+        else:
+            proc.kill()
+    except ProcessLookupError:
+        pass
+
 
 class TestType(Enum):
     """Types of tests in the compatibility system."""
@@ -34,7 +117,11 @@ class TestType(Enum):
     CONTRACT = "contract"        # Tests interface contracts
 
 
-@dataclass
+# Serialized name of each test type, looked up once per result when saving
+_TEST_TYPE_VALUE = {t: t.value for t in TestType}
+
+
+@dataclass(slots=True)
 class TestResult:
     """Result of running a test."""
     test_id: str
@@ -47,7 +134,7 @@ class TestResult:
     timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
 
 
-@dataclass
+@dataclass(slots=True)
 class TestSuite:
     """Collection of related tests."""
     name: str
@@ -67,19 +154,58 @@ class IntegrationTestRunner:
     3. Run regression tests when modifying existing code
     """
 
-    def __init__(self, project_path: Path):
-        """Initialize the test runner for a project."""
+    def __init__(self, project_path: Path, compat_manager: Optional[Any] = None):
+        """
+        Initialize the test runner for a project.
+
+        Args:
+            project_path: Path to the project
+            compat_manager: CompatibilityManager to reuse for regression tests;
+                sharing one keeps its parsed features.json warm across calls
+        """
         self.project_path = project_path
         self.tests_path = project_path / "tests"
         self.results_path = project_path / "test_results"
         self.config_path = project_path / "test_config.json"
+        self._compat_manager = compat_manager
+
+        # Test runs may execute in parallel threads: the first config load
+        # writes the default config, and result records are appended from
+        # whichever thread finishes a test
+        self._config_lock = threading.Lock()
+        self._results_lock = threading.Lock()
+
+        # ((st_mtime_ns, st_size), parsed config) of the last config load
+        self._config_cache: Optional[Tuple[Tuple[int, int], Dict[str, Any]]] = None
+
+        # Set once test_results/ is known to exist, to skip the mkdir per run
+        self._results_dir_ready = False
 
     def load_test_config(self) -> Dict[str, Any]:
-        """Load test configuration."""
-        if not self.config_path.exists():
-            return self._create_default_config()
-        with open(self.config_path, 'r') as f:
-            return json.load(f)
+        """
+        Load test configuration.
+
+        The parsed config is reused until test_config.json changes on disk;
+        treat the returned dict as read-only.
+        """
+        with self._config_lock:
+            try:
+                stat = self.config_path.stat()
+            except FileNotFoundError:
+                config = self._create_default_config()
+                stat = self.config_path.stat()
+                self._config_cache = ((stat.st_mtime_ns, stat.st_size), config)
+                return config
+
+            key = (stat.st_mtime_ns, stat.st_size)
+            cached = self._config_cache
+            if cached is not None and cached[0] == key:
+                return cached[1]
+
+            with open(self.config_path, 'r') as f:
+                config = json.load(f)
+            self._config_cache = (key, config)
+            return config
 
     def _create_default_config(self) -> Dict[str, Any]:
         """Create default test configuration."""
@@ -88,17 +214,20 @@ class IntegrationTestRunner:
             "smoke_tests": {
                 "enabled": True,
                 "timeout_seconds": 30,
+                "capture": "stderr-only",  # or "all" to include stdout in failure messages
                 "tests": [
                     {
                         "id": "SMOKE001",
                         "name": "Project builds successfully",
                         "command": "echo 'Build check placeholder'",
+                        "argv": ["echo", "Build check placeholder"],
                         "expected_exit_code": 0
                     },
                     {
                         "id": "SMOKE002",
                         "name": "Core dependencies available",
                         "command": "echo 'Dependency check placeholder'",
+                        "argv": ["echo", "Dependency check placeholder"],
                         "expected_exit_code": 0
                     }
                 ]
@@ -106,12 +235,14 @@ class IntegrationTestRunner:
             "integration_tests": {
                 "enabled": True,
                 "timeout_seconds": 120,
-                "test_directory": "tests/integration"
+                "test_directory": "tests/integration",
+                "parallel_workers": "auto"  # pytest-xdist -n value; 0 runs serially
             },
             "regression_tests": {
                 "enabled": True,
                 "timeout_seconds": 300,
-                "run_all_on_change": True
+                "run_all_on_change": True,
+                "parallel_workers": "auto"
             }
         }
 
@@ -127,6 +258,8 @@ class IntegrationTestRunner:
         Run smoke tests to verify basic system health.
 
         These tests should be FAST and run BEFORE any implementation.
+        The commands are independent, so they run concurrently in a private
+        event loop; call this from a worker thread when a loop is already running.
         """
         config = self.load_test_config()
         smoke_config = config.get("smoke_tests", {})
@@ -134,27 +267,66 @@ class IntegrationTestRunner:
         if not smoke_config.get("enabled", True):
             return []
 
-        results = []
-        for test in smoke_config.get("tests", []):
-            result = self._run_single_test(
+        # Each result is appended to the run's file as soon as its test finishes
+        result_file = self._new_result_file("smoke")
+        return asyncio.run(self._run_smoke_async(smoke_config, result_file))
+
+    async def _run_smoke_async(
+        self,
+        smoke_config: Dict[str, Any],
+        result_file: Path
+    ) -> List[TestResult]:
+        """Launch every smoke test at once and collect results in config order."""
+        timeout = smoke_config.get("timeout_seconds", 30)
+        capture = smoke_config.get("capture", "stderr-only")
+        tests = smoke_config.get("tests", [])
+
+        async def run_and_record(test: Dict[str, Any]) -> TestResult:
+            result = await self._run_single_test_async(
                 test_id=test["id"],
                 test_name=test["name"],
                 command=test.get("command", "echo 'No command'"),
                 expected_exit_code=test.get("expected_exit_code", 0),
                 test_type=TestType.SMOKE,
-                timeout=smoke_config.get("timeout_seconds", 30)
+                timeout=timeout,
+                argv=test.get("argv"),
+                capture=capture
             )
-            results.append(result)
+            self._append_result(result_file, result)
+            return result
 
-        self._save_results(results, "smoke")
+        outcomes = await asyncio.gather(
+            *[run_and_record(test) for test in tests],
+            return_exceptions=True
+        )
+
+        results = []
+        for test, outcome in zip(tests, outcomes):
+            if isinstance(outcome, BaseException):
+                outcome = TestResult(
+                    test_id=test.get("id", "UNKNOWN"),
+                    test_name=test.get("name", ""),
+                    test_type=TestType.SMOKE,
+                    passed=False,
+                    duration_ms=0,
+                    error_message=str(outcome)
+                )
+                self._append_result(result_file, outcome)
+            results.append(outcome)
         return results
 
-    def run_integration_tests(self, feature_ids: List[str] = None) -> List[TestResult]:
+    def run_integration_tests(
+        self,
+        feature_ids: List[str] = None,
+        parallel_workers: Optional[Any] = None
+    ) -> List[TestResult]:
         """
         Run integration tests for specific features or all features.
 
         Args:
             feature_ids: List of feature IDs to test. If None, runs all.
+            parallel_workers: pytest-xdist worker count overriding the
+                integration_tests config (used by regression runs)
         """
         config = self.load_test_config()
         int_config = config.get("integration_tests", {})
@@ -168,11 +340,14 @@ class IntegrationTestRunner:
         results = []
         if test_dir.exists():
             # Run pytest on integration tests
+            if parallel_workers is None:
+                parallel_workers = int_config.get("parallel_workers", 0)
             result = self._run_pytest(
                 test_dir=test_dir,
                 test_type=TestType.INTEGRATION,
                 timeout=int_config.get("timeout_seconds", 120),
-                feature_ids=feature_ids
+                feature_ids=feature_ids,
+                parallel_workers=parallel_workers
             )
             results.extend(result)
 
@@ -184,7 +359,8 @@ class IntegrationTestRunner:
         Run regression tests for a feature that was modified.
 
         This finds all tests related to the feature and its dependents,
-        then runs them to ensure nothing broke.
+        then runs them to ensure nothing broke. All affected features are
+        selected by one marker expression, so this is a single pytest process.
         """
         config = self.load_test_config()
         reg_config = config.get("regression_tests", {})
@@ -192,17 +368,24 @@ class IntegrationTestRunner:
         if not reg_config.get("enabled", True):
             return []
 
-        # Import here to avoid circular dependency
-        from config.compatibility import CompatibilityManager
+        compat_manager = self._compat_manager
+        if compat_manager is None:
+            # Import here to avoid circular dependency
+            from config.compatibility import CompatibilityManager
 
-        compat_manager = CompatibilityManager(self.project_path)
+            compat_manager = self._compat_manager = CompatibilityManager(self.project_path)
 
-        # Get all features that depend on the changed feature
+        # Get all features that depend on the changed feature; the manager
+        # serves this from its reverse-dependency index, which is rebuilt only
+        # when features.json changes, so repeated regression runs need no cache here
         dependents = compat_manager.get_dependent_features(changed_feature_id)
         features_to_test = [changed_feature_id] + dependents
 
         # Run integration tests for all affected features
-        results = self.run_integration_tests(feature_ids=features_to_test)
+        results = self.run_integration_tests(
+            feature_ids=features_to_test,
+            parallel_workers=reg_config.get("parallel_workers", 0)
+        )
 
         self._save_results(results, "regression")
         return results
@@ -214,23 +397,47 @@ class IntegrationTestRunner:
         command: str,
         expected_exit_code: int,
         test_type: TestType,
-        timeout: int
+        timeout: int,
+        argv: Optional[List[str]] = None
     ) -> TestResult:
-        """Run a single test command."""
-        start_time = datetime.now()
+        """
+        Run a single test command.
 
-        try:
-            result = subprocess.run(
-                command,
-                shell=True,
-                cwd=str(self.project_path),
-                capture_output=True,
-                text=True,
-                timeout=timeout
-            )
+        Plain commands (or a configured argv) are executed directly; commands
+        using shell syntax still go through the shell. Each test runs in its
+        own session so a timeout kills the whole process group.
+        """
+        start_ns = time.perf_counter_ns()
+        args = _command_argv(command, argv)
+        popen_kwargs = dict(
+            cwd=str(self.project_path),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            start_new_session=True
+        )
 
-            duration = int((datetime.now() - start_time).total_seconds() * 1000)
-            passed = result.returncode == expected_exit_code
+        try:
+            proc = None
+            if args is not None:
+                try:
+                    proc = subprocess.Popen(args, **popen_kwargs)
+                except OSError:
+                    # Not an executable (e.g. a shell builtin such as `exit 1`)
+                    proc = None
+            if proc is None:
+                proc = subprocess.Popen(command, shell=True, **popen_kwargs)
+
+            with proc:
+                try:
+                    _, stderr = proc.communicate(timeout=timeout)
+                except subprocess.TimeoutExpired:
+                    _kill_process_group(proc)
+                    proc.communicate()
+                    raise
+
+            duration = (time.perf_counter_ns() - start_ns) // 1_000_000
+            passed = proc.returncode == expected_exit_code
 
             return TestResult(
                 test_id=test_id,
@@ -238,7 +445,7 @@ class IntegrationTestRunner:
                 test_type=test_type,
                 passed=passed,
                 duration_ms=duration,
-                error_message=result.stderr if not passed else None
+                error_message=stderr if not passed else None
             )
 
         except subprocess.TimeoutExpired:
@@ -262,20 +469,109 @@ class IntegrationTestRunner:
                 error_message=str(e)
             )
 
+    async def _run_single_test_async(
+        self,
+        test_id: str,
+        test_name: str,
+        command: str,
+        expected_exit_code: int,
+        test_type: TestType,
+        timeout: int,
+        argv: Optional[List[str]] = None,
+        capture: str = "stderr-only"
+    ) -> TestResult:
+        """
+        Run a single test command without blocking the event loop (see _run_single_test).
+
+        Only stderr is kept by default, since it is all a failed result reports;
+        capture="all" also keeps stdout and prepends it to the failure message.
+        """
+        start_ns = time.perf_counter_ns()
+        args = _command_argv(command, argv)
+        capture_stdout = capture == "all"
+        popen_kwargs = dict(
+            cwd=str(self.project_path),
+            stdout=asyncio.subprocess.PIPE if capture_stdout else asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE,
+            start_new_session=True
+        )
+
+        try:
+            proc = None
+            if args is not None:
+                try:
+                    proc = await asyncio.create_subprocess_exec(*args, **popen_kwargs)
+                except OSError:
+                    # Not an executable (e.g. a shell builtin such as `exit 1`)
+                    proc = None
+            if proc is None:
+                proc = await asyncio.create_subprocess_shell(command, **popen_kwargs)
+
+            try:
+                stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=timeout)
+            except asyncio.TimeoutError:
+                _kill_process_group(proc)
+                await proc.wait()
+                return TestResult(
+                    test_id=test_id,
+                    test_name=test_name,
+                    test_type=test_type,
+                    passed=False,
+                    duration_ms=timeout * 1000,
+                    error_message=f"Test timed out after {timeout} seconds"
+                )
+
+            duration = (time.perf_counter_ns() - start_ns) // 1_000_000
+            passed = proc.returncode == expected_exit_code
+
+            error_message = None
+            if not passed:
+                output = stdout + stderr if capture_stdout else stderr
+                error_message = output.decode(errors="replace")
+
+            return TestResult(
+                test_id=test_id,
+                test_name=test_name,
+                test_type=test_type,
+                passed=passed,
+                duration_ms=duration,
+                error_message=error_message
+            )
+
+        except Exception as e:
+            return TestResult(
+                test_id=test_id,
+                test_name=test_name,
+                test_type=test_type,
+                passed=False,
+                duration_ms=0,
+                error_message=str(e)
+            )
+
     def _run_pytest(
         self,
         test_dir: Path,
         test_type: TestType,
         timeout: int,
-        feature_ids: List[str] = None
+        feature_ids: List[str] = None,
+        parallel_workers: Optional[Any] = None
     ) -> List[TestResult]:
-        """Run pytest on a directory and parse results."""
+        """
+        Run pytest on a directory and parse results.
+
+        When parallel_workers is set and pytest-xdist is installed for the
+        project's python, tests are spread across workers (one file per
+        worker); otherwise they run serially.
+        """
         # Build pytest command
         cmd = f"python -m pytest {test_dir} -v --tb=short"
 
+        if parallel_workers and _xdist_available(str(self.project_path)):
+            cmd += f" -n {parallel_workers} --dist=loadfile"
+
         if feature_ids:
             # Filter tests by feature markers if supported
-            markers = " or ".join([f"feature_{fid}" for fid in feature_ids])
+            markers = _build_marker(tuple(feature_ids))
             cmd += f" -m '{markers}'"
 
         result = self._run_single_test(
@@ -289,55 +585,93 @@ class IntegrationTestRunner:
 
         return [result]
 
+    def _new_result_file(self, test_type: str) -> Path:
+        """Path of the NDJSON file for a new test run."""
+        if not self._results_dir_ready:
+            self.results_path.mkdir(parents=True, exist_ok=True)
+            self._results_dir_ready = True
+
+        # The nanosecond clock keeps names unique for runs within the same second;
+        # the date prefix keeps the directory readable
+        name = f"{test_type}_{time.strftime('%Y%m%d')}_{time.time_ns()}.ndjson"
+        return self.results_path / name
+
+    @staticmethod
+    def _result_line(result: TestResult) -> bytes:
+        """Serialize one result as a newline-terminated JSON record."""
+        return _json_dumps({
+            "test_id": result.test_id,
+            "test_name": result.test_name,
+            "test_type": _TEST_TYPE_VALUE[result.test_type],
+            "passed": result.passed,
+            "duration_ms": result.duration_ms,
+            "error_message": result.error_message,
+            "timestamp": result.timestamp
+        }) + b"\n"
+
+    def _append_result(self, result_file: Path, result: TestResult):
+        """Append one finished result to a run file, so a crash keeps earlier results."""
+        line = self._result_line(result)
+        with self._results_lock, open(result_file, 'ab') as f:
+            f.write(line)
+
     def _save_results(self, results: List[TestResult], test_type: str):
         """Save test results for later analysis."""
-        self.results_path.mkdir(parents=True, exist_ok=True)
-
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        result_file = self.results_path / f"{test_type}_{timestamp}.json"
-
-        with open(result_file, 'w') as f:
-            json.dump(
-                [
-                    {
-                        "test_id": r.test_id,
-                        "test_name": r.test_name,
-                        "test_type": r.test_type.value,
-                        "passed": r.passed,
-                        "duration_ms": r.duration_ms,
-                        "error_message": r.error_message,
-                        "timestamp": r.timestamp
-                    }
-                    for r in results
-                ],
-                f,
-                indent=2
-            )
+        result_file = self._new_result_file(test_type)
+        data = b"".join([self._result_line(r) for r in results])
+
+        with self._results_lock, open(result_file, 'ab') as f:
+            f.write(data)
+
+    @staticmethod
+    def _iter_result_lines(f) -> Iterator[Dict[str, Any]]:
+        """Yield the records of an NDJSON result file, one line at a time."""
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                yield json_loads(line)
+            except ValueError:
+                # A run interrupted mid-write leaves a truncated last line
+                continue
 
     def generate_test_report(self) -> Dict[str, Any]:
         """Generate a summary report of recent test runs."""
-        if not self.results_path.exists():
+        try:
+            entries = os.scandir(self.results_path)
+        except FileNotFoundError:
             return {"message": "No test results found"}
 
-        # Get recent result files
-        result_files = sorted(self.results_path.glob("*.json"), reverse=True)[:10]
+        # Get the ten most recently written result files without sorting the whole history
+        with entries:
+            result_files = heapq.nlargest(10, (
+                entry for entry in entries if entry.name.endswith((".ndjson", ".json"))
+            ), key=lambda entry: (entry.stat().st_mtime_ns, entry.name))
 
-        all_results = []
+        # Count in one pass per file; only the first 5 failures (newest files
+        # first) are kept, so no combined list of every record is built
+        total = passed = 0
+        recent_failures = []
         for rf in result_files:
-            with open(rf, 'r') as f:
-                all_results.extend(json.load(f))
-
-        passed = sum(1 for r in all_results if r.get("passed"))
-        failed = sum(1 for r in all_results if not r.get("passed"))
+            with open(rf, 'rb') as f:
+                if rf.name.endswith(".ndjson"):
+                    records = self._iter_result_lines(f)
+                else:
+                    # Result files written before NDJSON hold a single JSON array
+                    records = json_loads(f.read())
+                for r in records:
+                    total += 1
+                    if r.get("passed"):
+                        passed += 1
+                    elif len(recent_failures) < 5:
+                        recent_failures.append(r)
 
         return {
-            "total_tests": len(all_results),
+            "total_tests": total,
             "passed": passed,
-            "failed": failed,
-            "pass_rate": f"{passed/len(all_results)*100:.1f}%" if all_results else "N/A",
-            "recent_failures": [
-                r for r in all_results if not r.get("passed")
-            ][:5]
+            "failed": total - passed,
+            "pass_rate": f"{passed/total*100:.1f}%" if total else "N/A",
+            "recent_failures": recent_failures
         }
 
 
@@ -17,8 +17,8 @@ Usage:
 """
 
 import argparse
-import asyncio
 import json
+import os
 import sys
 from pathlib import Path
 from typing import Optional
@@ -30,10 +30,12 @@ sys.path.insert(0, str(Path(__file__).parent))
 from dotenv import load_dotenv
 env_path = Path(__file__).parent / ".env"
 load_dotenv(env_path, override=True)
+os.environ["_CODING_AGENT_ENV_LOADED"] = "1"
 
 from config.agent_config import AgentConfig, ProjectType, default_config
-from agents.initializer_agent import InitializerAgent
-from agents.coding_agent import CodingAgent
+
+# The agent modules (and asyncio) are imported inside the commands that use
+# them, so 'templates' and --help start without loading the agent stack
 
 
 def print_banner():
@@ -66,6 +68,9 @@ def cmd_init(args):
         return 1
 
     # Create and run the Initializer Agent
+    import asyncio
+    from agents.initializer_agent import InitializerAgent
+
     agent = InitializerAgent(
         project_name=args.name,
         project_type=project_type,
@@ -104,6 +109,9 @@ def cmd_work(args):
         return 1
 
     # Create and run the Coding Agent
+    import asyncio
+    from agents.coding_agent import CodingAgent
+
     agent = CodingAgent(project_name=args.project)
 
     # Get and display initial status
@@ -151,12 +159,11 @@ def cmd_status(args):
     """Handle the 'status' command to view project status."""
     print_banner()
 
-    projects_dir = default_config.projects_dir
+    from agents.coding_agent import CodingAgent
 
     if args.project:
         # Show status for specific project
-        agent = CodingAgent(project_name=args.project)
-        status = agent.get_status()
+        status = CodingAgent.load_status(args.project)
 
         if not status['exists']:
             print(f"Error: Project '{args.project}' not found.")
@@ -180,13 +187,12 @@ def cmd_status(args):
                 print(f"  - {session}")
 
     else:
-        # List all projects
-        if not projects_dir.exists():
-            print("No projects found. Create one with:")
-            print("  python main.py init --name \"my-project\" --type generic")
-            return 0
-
-        projects = [d for d in projects_dir.iterdir() if d.is_dir()]
+        # List all projects (DirEntry.is_dir uses the type scandir already read)
+        try:
+            with os.scandir(default_config.projects_dir) as entries:
+                projects = sorted(entry.name for entry in entries if entry.is_dir())
+        except FileNotFoundError:
+            projects = []
 
         if not projects:
             print("No projects found. Create one with:")
@@ -197,12 +203,11 @@ def cmd_status(args):
         print(f"{'Name':<25} {'Progress':<15} {'Remaining':<10}")
         print("-"*60)
 
-        for project_dir in sorted(projects):
-            agent = CodingAgent(project_name=project_dir.name)
-            status = agent.get_status()
+        for name in projects:
+            status = CodingAgent.load_status(name)
 
             progress = f"{status['features_completed']}/{status['features_total']} ({status['completion_percentage']}%)"
-            print(f"{project_dir.name:<25} {progress:<15} {status['features_remaining']:<10}")
+            print(f"{name:<25} {progress:<15} {status['features_remaining']:<10}")
 
         print("-"*60)
         print(f"\nTotal: {len(projects)} project(s)")
@@ -211,6 +216,11 @@ def cmd_status(args):
     return 0
 
 
+def _load_template_json(template_file: Path):
+    """Read one template file, returning (stem, parsed template)."""
+    return template_file.stem, json.loads(template_file.read_bytes())
+
+
 def cmd_list_templates(args):
     """Handle listing available templates."""
     print_banner()
@@ -221,14 +231,19 @@ def cmd_list_templates(args):
         print("No templates found.")
         return 1
 
-    for template_file in sorted(templates_dir.glob("*.json")):
-        with open(template_file, 'r') as f:
-            template = json.load(f)
-            name = template.get('name', template_file.stem)
-            desc = template.get('description', 'No description')
-            feature_count = len(template.get('features', []))
+    # Read the templates concurrently; map() keeps them in sorted order
+    from concurrent.futures import ThreadPoolExecutor
+
+    template_files = sorted(templates_dir.glob("*.json"))
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        templates = list(executor.map(_load_template_json, template_files))
+
+    for stem, template in templates:
+        name = template.get('name', stem)
+        desc = template.get('description', 'No description')
+        feature_count = len(template.get('features', []))
 
-        print(f"\n{template_file.stem}")
+        print(f"\n{stem}")
         print(f"  Name: {name}")
         print(f"  Description: {desc}")
         print(f"  Features: {feature_count}")
@@ -289,6 +304,7 @@ Examples:
         default=None,
         help="Description of what the project should do"
     )
+    init_parser.set_defaults(func=cmd_init)
 
     # Work command
     work_parser = subparsers.add_parser(
@@ -305,6 +321,7 @@ Examples:
         default=None,
         help="Session ID to resume (optional)"
     )
+    work_parser.set_defaults(func=cmd_work)
 
     # Status command
     status_parser = subparsers.add_parser(
@@ -316,12 +333,14 @@ Examples:
         default=None,
         help="Name of specific project (optional, shows all if not specified)"
     )
+    status_parser.set_defaults(func=cmd_status)
 
     # Templates command
     templates_parser = subparsers.add_parser(
         "templates",
         help="List available project templates"
     )
+    templates_parser.set_defaults(func=cmd_list_templates)
 
     # Parse arguments
     args = parser.parse_args()
@@ -330,18 +349,8 @@ Examples:
         parser.print_help()
         return 0
 
-    # Route to appropriate command handler
-    if args.command == "init":
-        return cmd_init(args)
-    elif args.command == "work":
-        return cmd_work(args)
-    elif args.command == "status":
-        return cmd_status(args)
-    elif args.command == "templates":
-        return cmd_list_templates(args)
-    else:
-        parser.print_help()
-        return 0
+    # Route to the handler registered by the subcommand's set_defaults
+    return args.func(args)
 
 
 if __name__ == "__main__":
@@ -24,7 +24,7 @@ Usage:
     # Count records
     python odoo-query-helper.py --model res.partner --domain "[('customer_rank', '>', 0)]" --count
 
-    # Get field definitions
+    # Get field definitions (add labels and help texts with --fields-info-full)
     python odoo-query-helper.py --model res.partner --fields-info
 
     # List all models
@@ -32,51 +32,343 @@ Usage:
 
     # Read specific IDs
     python odoo-query-helper.py --model res.partner --ids "1,2,3" --fields "name,email"
+
+    # Keep an authenticated client warm; later calls are routed through it
+    python odoo-query-helper.py --daemon
 """
 
 import argparse
+import gzip
+import hashlib
+import itertools
 import json
 import os
+import re
 import sys
-from datetime import datetime
-from typing import Any, Dict, List, Optional
-import urllib.request
-import urllib.error
-import ssl
+import threading
+import time
+from typing import Any, BinaryIO, Dict, List, Optional, TextIO, Tuple
+from urllib.parse import urlsplit
+
+# http.client, ssl, ast, datetime and concurrent.futures are imported where they
+# are used: together they are most of the startup time, and --help, argument
+# errors and cache hits never need them
+
+# orjson serializes requests and output, and parses large responses, considerably
+# faster when installed
+try:
+    import orjson
+    from orjson import dumps as json_dumps, loads as json_loads
+
+    def json_dumps_indented(obj: Any) -> bytes:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_INDENT_2)
+except ImportError:
+    json_loads = json.loads
+
+    def json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode('utf-8')
+
+    def json_dumps_indented(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2, default=str).encode('utf-8')
+
+
+# Model metadata (fields_get, list_models) changes rarely, so it is cached on
+# disk and shared across invocations
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'odoo-query-helper')
+DEFAULT_CACHE_TTL = 3600
+# The user ID for a login only changes if the user is recreated
+UID_CACHE_TTL = 86400
+
+
+def _cache_path(key: Any) -> str:
+    """Path of the cache file for a JSON-serializable key."""
+    digest = hashlib.sha256(json.dumps(key).encode('utf-8')).hexdigest()
+    return os.path.join(CACHE_DIR, f"{digest}.json.gz")
+
+
+def _cache_get(key: Any, ttl: int) -> Any:
+    """Return the cached value for key, or None if it is missing or older than ttl seconds."""
+    path = _cache_path(key)
+    try:
+        if time.time() - os.path.getmtime(path) > ttl:
+            return None
+        with gzip.open(path, 'rb') as f:
+            return json_loads(f.read())
+    except (OSError, ValueError):
+        return None
+
+
+def _cache_put(key: Any, value: Any):
+    """Store value for key; the cache is best-effort, so write failures are ignored."""
+    path = _cache_path(key)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with gzip.open(tmp_path, 'wb') as f:
+            f.write(json_dumps(value))
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
 
 
 class OdooQueryError(Exception):
     """Custom exception for Odoo query errors with diagnostic info."""
-    def __init__(self, message: str, error_type: str, diagnostics: List[str]):
+
+    # Diagnostic lines per template, formatted with the error's context only
+    # when the diagnostics are read
+    DIAGNOSTICS = {
+        "configuration": (
+            "Set the required environment variables:",
+            "  ODOO_URL={url}",
+            "  ODOO_DB={db}",
+            "  ODOO_USERNAME={username}",
+            "  ODOO_PASSWORD=<api-key-or-password>",
+            "",
+            "You can set these in your shell or .env file."
+        ),
+        "api_error": (
+            "The Odoo server returned an error.",
+            "Error: {error}",
+            "{detail_line}",
+            "",
+            "Common causes:",
+            "- Invalid model name",
+            "- Invalid field name in domain or fields list",
+            "- Permission denied for this operation"
+        ),
+        "connection": (
+            "Could not connect to Odoo at {url}",
+            "",
+            "Diagnostic checklist:",
+            "1. Is your VPN connected? (if required)",
+            "2. Can you access the URL in a browser?",
+            "3. Is the Odoo service running?",
+            "4. Check ODOO_URL is correct: {url}",
+            "",
+            "Technical error: {error}"
+        ),
+        "response": (
+            "The server returned an invalid response.",
+            "This usually means:",
+            "- The URL is incorrect (not an Odoo instance)",
+            "- There's a proxy/firewall blocking the request",
+            "- The Odoo service is starting up",
+            "",
+            "URL attempted: {url}"
+        ),
+        "authentication": (
+            "Could not authenticate with Odoo.",
+            "",
+            "Diagnostic checklist:",
+            "1. Is ODOO_USERNAME correct? (current: {username})",
+            "2. Is ODOO_PASSWORD an API key? (Odoo 14+ requires API keys)",
+            "3. Does this user have API access enabled?",
+            "4. Is database name correct? (current: {db})",
+            "",
+            "Tip: In Odoo 14+, create an API key at:",
+            "Settings > Users > [Your User] > API Keys"
+        ),
+        "authentication_error": (
+            "Unexpected error during authentication: {error}",
+            "",
+            "Check your credentials and try again."
+        ),
+        "security": (
+            "The method '{method}' is not permitted.",
+            "",
+            "This tool is READ-ONLY for safety.",
+            "Allowed methods: {allowed}",
+            "",
+            "To modify data, use the Odoo web interface."
+        ),
+        "domain": (
+            "Could not parse the domain filter.",
+            "",
+            "Domain format: list of tuples, e.g.:",
+            "  [('field', 'operator', value)]",
+            "",
+            "Examples:",
+            "  [(\'customer_rank\', \'>\', 0)]",
+            "  [(\'name\', \'ilike\', \'%test%\'), (\'active\', \'=\', True)]",
+            "",
+            "Your domain: {domain}",
+            "Parse error: {error}"
+        ),
+        "ids": (
+            "IDs must be comma-separated integers.",
+            "Example: --ids \"1,2,3,4,5\"",
+            "Your input: {ids}",
+            "Error: {error}"
+        ),
+    }
+
+    def __init__(self, message: str, error_type: str, template: Optional[str] = None, **context):
         self.message = message
         self.error_type = error_type
-        self.diagnostics = diagnostics
+        self.template = template or error_type
+        self.context = context
+        self._diagnostics: Optional[List[str]] = None
         super().__init__(self.message)
 
+    @property
+    def diagnostics(self) -> List[str]:
+        """Diagnostic lines for the error, built from its template on first use."""
+        if self._diagnostics is None:
+            self._diagnostics = [line.format(**self.context) for line in self.DIAGNOSTICS[self.template]]
+        return self._diagnostics
+
 
 class OdooClient:
     """JSON-RPC client for Odoo - READ ONLY operations."""
 
     # Whitelist of allowed methods (READ-ONLY)
-    ALLOWED_METHODS = {'search_read', 'read', 'search_count', 'fields_get', 'search'}
-
-    def __init__(self, verify_ssl: bool = True):
-        self.url = os.environ.get('ODOO_URL', '').rstrip('/')
-        self.db = os.environ.get('ODOO_DB', '')
-        self.username = os.environ.get('ODOO_USERNAME', '')
-        self.password = os.environ.get('ODOO_PASSWORD', '')
+    ALLOWED_METHODS = frozenset({'search_read', 'read', 'search_count', 'fields_get', 'search', 'web_search_read'})
+    _ALLOWED_METHODS_STR = ", ".join(sorted(ALLOWED_METHODS))
+
+    # JSON responses compress well, so large reads are requested gzipped
+    REQUEST_HEADERS = {'Content-Type': 'application/json', 'Accept-Encoding': 'gzip'}
+
+    # fields_get attributes; 'string' and 'help' are translated server-side,
+    # which makes them the expensive part of the call
+    CHEAP_FIELD_ATTRIBUTES = ('type', 'required', 'readonly', 'selection', 'relation', 'store')
+    FULL_FIELD_ATTRIBUTES = CHEAP_FIELD_ATTRIBUTES + ('string', 'help')
+
+    def __init__(self, verify_ssl: bool = True, cache_ttl: int = DEFAULT_CACHE_TTL,
+                 environ: Optional[Dict[str, str]] = None):
+        # The daemon passes each caller's ODOO_* variables instead of its own
+        environ = os.environ if environ is None else environ
+        self.url = environ.get('ODOO_URL', '').rstrip('/')
+        self.db = environ.get('ODOO_DB', '')
+        self.username = environ.get('ODOO_USERNAME', '')
+        self.password = environ.get('ODOO_PASSWORD', '')
         self.uid = None
-        self._request_id = 0
+        self._uid_from_cache = False
+        self._request_ids = itertools.count(1)
+        # Per-thread JSON-RPC envelope, refilled in place for each single call
+        self._local = threading.local()
         self.verify_ssl = verify_ssl
-
-        # Create SSL context - optionally disable verification for servers with cert issues
-        if verify_ssl:
+        # Seconds model metadata is served from the disk cache; 0 disables it
+        self.cache_ttl = cache_ttl
+
+        # Reuse the user ID from an earlier run to skip the authenticate round trip
+        if cache_ttl > 0:
+            self.uid = _cache_get(self._uid_cache_key(), UID_CACHE_TTL)
+            self._uid_from_cache = self.uid is not None
+
+        # SSL context, created with the first HTTPS connection
+        self.ssl_context = None
+
+        # Idle keep-alive connections (http.client.HTTPConnection), so authenticate,
+        # search_read and search_count pay a single TCP+TLS handshake; parallel
+        # page reads each check one out
+        self._idle_conns: List[Any] = []
+        # httpx HTTP/2 client, set up for parallel page reads when httpx and h2 are
+        # installed; concurrent requests then share one multiplexed connection
+        self._http2 = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Close the idle kept-alive connections to Odoo."""
+        while self._idle_conns:
+            self._idle_conns.pop().close()
+        if self._http2 is not None:
+            self._http2.close()
+            self._http2 = None
+
+    def _get_ssl_context(self):
+        """Return the SSL context, creating it on first use."""
+        if self.ssl_context is None:
+            import ssl
+
+            # Create SSL context - optionally disable verification for servers with cert issues
             self.ssl_context = ssl.create_default_context()
+            if not self.verify_ssl:
+                # Disable SSL verification (some Odoo servers have non-standard certs)
+                self.ssl_context.check_hostname = False
+                self.ssl_context.verify_mode = ssl.CERT_NONE
+        return self.ssl_context
+
+    def _new_connection(self):
+        """Open a connection (http.client.HTTPConnection) to the Odoo server."""
+        import http.client
+
+        parts = urlsplit(self.url)
+        if parts.scheme == 'https':
+            return http.client.HTTPSConnection(parts.netloc, timeout=30, context=self._get_ssl_context())
+        return http.client.HTTPConnection(parts.netloc, timeout=30)
+
+    def _enable_http2(self) -> bool:
+        """Switch to an HTTP/2 transport if httpx and h2 are installed; returns whether it is on."""
+        if self._http2 is None:
+            # HTTP/2 is negotiated during the TLS handshake, so plain http stays on HTTP/1.1
+            if not self.url.startswith('https://'):
+                return False
+            import importlib.util
+
+            # httpx needs the h2 package for http2=True
+            if importlib.util.find_spec('h2') is None:
+                return False
+            try:
+                import httpx
+            except ImportError:
+                return False
+            self._http2 = httpx.Client(http2=True, verify=self._get_ssl_context(), timeout=30)
+        return True
+
+    def _post(self, endpoint: str, data: bytes) -> Tuple[int, str, bytes]:
+        """POST a request body over a kept-alive connection; returns (status, reason, body)."""
+        if self._http2 is not None:
+            return self._post_http2(endpoint, data)
+
+        path = urlsplit(self.url).path + endpoint
+
+        try:
+            conn = self._idle_conns.pop()
+            # The server may drop an idle keep-alive connection; a reused one gets one retry
+            retry = True
+        except IndexError:
+            conn = self._new_connection()
+            retry = False
+
+        while True:
+            try:
+                conn.request('POST', path, body=data, headers=self.REQUEST_HEADERS)
+                response = conn.getresponse()
+                body = response.read()
+                break
+            except (ConnectionResetError, BrokenPipeError):
+                conn.close()
+                if not retry:
+                    raise
+                conn = self._new_connection()
+                retry = False
+            except Exception:
+                conn.close()
+                raise
+
+        if response.will_close:
+            conn.close()
         else:
-            # Disable SSL verification (some Odoo servers have non-standard certs)
-            self.ssl_context = ssl.create_default_context()
-            self.ssl_context.check_hostname = False
-            self.ssl_context.verify_mode = ssl.CERT_NONE
+            self._idle_conns.append(conn)
+        if response.getheader('Content-Encoding') == 'gzip':
+            body = gzip.decompress(body)
+        return response.status, response.reason, body
+
+    def _post_http2(self, endpoint: str, data: bytes) -> Tuple[int, str, bytes]:
+        """_post() over the shared HTTP/2 client; transport errors surface as OSError."""
+        import httpx
+
+        try:
+            response = self._http2.post(self.url + endpoint, content=data, headers=self.REQUEST_HEADERS)
+        except httpx.TransportError as e:
+            raise ConnectionError(str(e)) from e
+        # httpx has already decoded any gzip Content-Encoding
+        return response.status_code, response.reason_phrase, response.content
 
     def _validate_config(self):
         """Validate that all required environment variables are set."""
@@ -94,94 +386,77 @@ class OdooClient:
             raise OdooQueryError(
                 f"Missing environment variables: {', '.join(missing)}",
                 "configuration",
-                [
-                    "Set the required environment variables:",
-                    f"  ODOO_URL={self.url or '<your-odoo-url>'}",
-                    f"  ODOO_DB={self.db or '<database-name>'}",
-                    f"  ODOO_USERNAME={self.username or '<username>'}",
-                    "  ODOO_PASSWORD=<api-key-or-password>",
-                    "",
-                    "You can set these in your shell or .env file."
-                ]
+                url=self.url or '<your-odoo-url>',
+                db=self.db or '<database-name>',
+                username=self.username or '<username>'
             )
 
     def _json_rpc(self, endpoint: str, method: str, params: Dict[str, Any]) -> Any:
         """Execute a JSON-RPC call to Odoo."""
-        self._request_id += 1
+        # The envelope is serialized before this thread can make another call,
+        # so it is safe to reuse
+        envelope = getattr(self._local, 'envelope', None)
+        if envelope is None:
+            envelope = self._local.envelope = {"jsonrpc": "2.0"}
+        envelope["method"] = method
+        envelope["params"] = params
+        envelope["id"] = next(self._request_ids)
 
-        payload = {
-            "jsonrpc": "2.0",
-            "method": method,
-            "params": params,
-            "id": self._request_id
-        }
+        return self._unwrap(self._send(endpoint, envelope))
+
+    def _send(self, endpoint: str, payload: Any) -> Any:
+        """POST a JSON-RPC request and return the decoded response."""
+        import http.client
 
         url = f"{self.url}{endpoint}"
-        data = json.dumps(payload).encode('utf-8')
+        data = json_dumps(payload)
 
         try:
-            req = urllib.request.Request(
-                url,
-                data=data,
-                headers={'Content-Type': 'application/json'}
-            )
-
-            with urllib.request.urlopen(req, context=self.ssl_context, timeout=30) as response:
-                result = json.loads(response.read().decode('utf-8'))
-
-            if 'error' in result:
-                error_data = result['error']
-                error_message = error_data.get('message', 'Unknown error')
-                error_detail = error_data.get('data', {}).get('message', '')
-
-                raise OdooQueryError(
-                    f"Odoo API Error: {error_message}. {error_detail}",
-                    "api_error",
-                    [
-                        "The Odoo server returned an error.",
-                        f"Error: {error_message}",
-                        f"Detail: {error_detail}" if error_detail else "",
-                        "",
-                        "Common causes:",
-                        "- Invalid model name",
-                        "- Invalid field name in domain or fields list",
-                        "- Permission denied for this operation"
-                    ]
-                )
-
-            return result.get('result')
-
-        except urllib.error.URLError as e:
+            status, reason, body = self._post(endpoint, data)
+            if status < 400:
+                return json_loads(body)
+
+            # Odoo answers many server errors with a 500 that still carries a
+            # JSON-RPC error object; surface that rather than the bare status
+            try:
+                response = json_loads(body)
+            except ValueError:
+                response = None
+            if isinstance(response, dict) and 'error' in response:
+                return response
+            raise http.client.HTTPException(f"HTTP Error {status}: {reason}")
+
+        except (OSError, http.client.HTTPException) as e:
             raise OdooQueryError(
                 f"Connection failed: {str(e)}",
                 "connection",
-                [
-                    f"Could not connect to Odoo at {self.url}",
-                    "",
-                    "Diagnostic checklist:",
-                    "1. Is your VPN connected? (if required)",
-                    "2. Can you access the URL in a browser?",
-                    "3. Is the Odoo service running?",
-                    f"4. Check ODOO_URL is correct: {self.url}",
-                    "",
-                    f"Technical error: {str(e)}"
-                ]
+                url=self.url,
+                error=str(e)
             )
         except json.JSONDecodeError as e:
             raise OdooQueryError(
                 f"Invalid response from Odoo: {str(e)}",
                 "response",
-                [
-                    "The server returned an invalid response.",
-                    "This usually means:",
-                    "- The URL is incorrect (not an Odoo instance)",
-                    "- There's a proxy/firewall blocking the request",
-                    "- The Odoo service is starting up",
-                    "",
-                    f"URL attempted: {url}"
-                ]
+                url=url
             )
 
+    @staticmethod
+    def _unwrap(response: Dict[str, Any]) -> Any:
+        """Return the result of a JSON-RPC response, raising on an error response."""
+        if 'error' in response:
+            error_data = response['error']
+            error_message = error_data.get('message', 'Unknown error')
+            error_detail = error_data.get('data', {}).get('message', '')
+
+            raise OdooQueryError(
+                f"Odoo API Error: {error_message}. {error_detail}",
+                "api_error",
+                error=error_message,
+                detail_line=f"Detail: {error_detail}" if error_detail else ""
+            )
+
+        return response.get('result')
+
     def authenticate(self) -> int:
         """Authenticate with Odoo and return user ID."""
         self._validate_config()
@@ -201,21 +476,14 @@ class OdooClient:
                 raise OdooQueryError(
                     "Authentication failed",
                     "authentication",
-                    [
-                        "Could not authenticate with Odoo.",
-                        "",
-                        "Diagnostic checklist:",
-                        f"1. Is ODOO_USERNAME correct? (current: {self.username})",
-                        "2. Is ODOO_PASSWORD an API key? (Odoo 14+ requires API keys)",
-                        "3. Does this user have API access enabled?",
-                        f"4. Is database name correct? (current: {self.db})",
-                        "",
-                        "Tip: In Odoo 14+, create an API key at:",
-                        "Settings > Users > [Your User] > API Keys"
-                    ]
+                    username=self.username,
+                    db=self.db
                 )
 
             self.uid = result
+            self._uid_from_cache = False
+            if self.cache_ttl > 0:
+                _cache_put(self._uid_cache_key(), result)
             return result
 
         except OdooQueryError:
@@ -224,55 +492,73 @@ class OdooClient:
             raise OdooQueryError(
                 f"Authentication error: {str(e)}",
                 "authentication",
-                [
-                    f"Unexpected error during authentication: {str(e)}",
-                    "",
-                    "Check your credentials and try again."
-                ]
+                template="authentication_error",
+                error=str(e)
             )
 
-    def execute(self, model: str, method: str, *args, **kwargs) -> Any:
-        """Execute a method on an Odoo model (READ-ONLY methods only)."""
-        # Safety check: only allow read operations
+    def _check_method(self, method: str):
+        """Reject any method outside the READ-ONLY whitelist."""
         if method not in self.ALLOWED_METHODS:
             raise OdooQueryError(
                 f"Method '{method}' is not allowed",
                 "security",
-                [
-                    f"The method '{method}' is not permitted.",
-                    "",
-                    "This tool is READ-ONLY for safety.",
-                    "Allowed methods: " + ", ".join(sorted(self.ALLOWED_METHODS)),
-                    "",
-                    "To modify data, use the Odoo web interface."
-                ]
+                method=method,
+                allowed=self._ALLOWED_METHODS_STR
             )
 
+    def _execute_params(self, model: str, method: str, args: List, kwargs: Dict) -> Dict[str, Any]:
+        """JSON-RPC params for an execute_kw call on a model."""
+        return {
+            "service": "object",
+            "method": "execute_kw",
+            "args": [
+                self.db,
+                self.uid,
+                self.password,
+                model,
+                method,
+                list(args),
+                kwargs
+            ]
+        }
+
+    def _uid_cache_key(self) -> List[str]:
+        """Disk cache key for the user ID; the password only enters it hashed."""
+        password_hash = hashlib.sha256(self.password.encode('utf-8')).hexdigest()
+        return ['uid', self.url, self.db, self.username, password_hash]
+
+    def _retry_on_stale_uid(self, call):
+        """Return call(); if a cached user ID is rejected, authenticate again and retry once."""
+        try:
+            return call()
+        except OdooQueryError as e:
+            stale = e.error_type == "api_error" and (
+                'AccessDenied' in e.message
+                or 'Access Denied' in e.message
+                or 'Session Expired' in e.message
+            )
+            if not (self._uid_from_cache and stale):
+                raise
+
+        self.authenticate()
+        return call()
+
+    def execute(self, model: str, method: str, *args, **kwargs) -> Any:
+        """Execute a method on an Odoo model (READ-ONLY methods only)."""
+        # Safety check: only allow read operations
+        self._check_method(method)
+
         if not self.uid:
             self.authenticate()
 
-        return self._json_rpc(
-            "/jsonrpc",
-            "call",
-            {
-                "service": "object",
-                "method": "execute_kw",
-                "args": [
-                    self.db,
-                    self.uid,
-                    self.password,
-                    model,
-                    method,
-                    list(args),
-                    kwargs
-                ]
-            }
+        return self._retry_on_stale_uid(
+            lambda: self._json_rpc("/jsonrpc", "call", self._execute_params(model, method, args, kwargs))
         )
 
-    def search_read(self, model: str, domain: List = None, fields: List[str] = None,
-                    limit: int = 100, offset: int = 0, order: str = None) -> List[Dict]:
-        """Search and read records from a model."""
-        domain = domain or []
+    @staticmethod
+    def search_read_kwargs(fields: List[str] = None, limit: int = 100, offset: int = 0,
+                           order: str = None) -> Dict[str, Any]:
+        """Keyword arguments for a search_read call."""
         kwargs = {'limit': limit, 'offset': offset}
 
         if fields:
@@ -280,8 +566,135 @@ class OdooClient:
         if order:
             kwargs['order'] = order
 
+        return kwargs
+
+    def search_read(self, model: str, domain: List = None, fields: List[str] = None,
+                    limit: int = 100, offset: int = 0, order: str = None) -> List[Dict]:
+        """Search and read records from a model."""
+        domain = domain or []
+        kwargs = self.search_read_kwargs(fields, limit, offset, order)
         return self.execute(model, 'search_read', domain, **kwargs)
 
+    def search_read_with_total(self, model: str, domain: List = None, fields: List[str] = None,
+                               limit: int = 100, offset: int = 0,
+                               order: str = None) -> Tuple[List[Dict], int]:
+        """
+        Search and read records, plus the total number of records matching the domain.
+
+        On Odoo 17+ both come from one web_search_read when fields are given
+        and the disk cache is on, since that path needs the server version
+        and the model's field types. Otherwise the count is only requested
+        when the page came back full, since a short page already tells us
+        the total.
+        """
+        domain = domain or []
+        kwargs = self.search_read_kwargs(fields, limit, offset, order)
+
+        if fields and self.cache_ttl > 0 and self.server_version() >= 17:
+            return self._web_search_read_as_search_read(model, domain, fields, limit, offset, order)
+
+        records = self.execute(model, 'search_read', domain, **kwargs)
+        return records, self.total_for_page(model, domain, records, limit, offset)
+
+    def web_search_read(self, model: str, domain: List, specification: Dict[str, Dict],
+                        limit: int = 100, offset: int = 0, order: str = None) -> Dict[str, Any]:
+        """
+        Search and read records plus the total match count in one call (Odoo 17+).
+
+        Returns {'length': total, 'records': [...]}, with fields given as a
+        web_read specification.
+        """
+        kwargs = {'specification': specification, 'limit': limit, 'offset': offset}
+        if order:
+            kwargs['order'] = order
+        return self.execute(model, 'web_search_read', domain or [], **kwargs)
+
+    def _web_search_read_as_search_read(self, model: str, domain: List, fields: List[str],
+                                        limit: int, offset: int,
+                                        order: Optional[str]) -> Tuple[List[Dict], int]:
+        """web_search_read with records shaped like search_read output, plus the total."""
+        # web_read returns a bare id for a many2one unless its display name is
+        # requested; search_read returns [id, display_name]
+        field_types = self.fields_get(model)
+        many2one = [f for f in fields if field_types.get(f, {}).get('type') == 'many2one']
+        specification = {f: {} for f in fields}
+        for f in many2one:
+            specification[f] = {'fields': {'display_name': {}}}
+
+        result = self.web_search_read(model, domain, specification, limit, offset, order)
+        records = result['records']
+        for record in records:
+            for f in many2one:
+                value = record.get(f)
+                record[f] = [value['id'], value['display_name']] if value else False
+        # An empty page past the end reports length == offset, not the real count
+        if not records and offset > 0:
+            return records, self.search_count(model, domain)
+        return records, result['length']
+
+    def server_version(self) -> int:
+        """Major version of the Odoo server, 0 if it cannot be told."""
+        info = self._cached(
+            ['version'],
+            lambda: self._json_rpc("/jsonrpc", "call", {"service": "common", "method": "version", "args": []})
+        )
+        # server_version_info starts with e.g. 17 or 'saas~17'
+        major = re.search(r'\d+', str((info or {}).get('server_version_info', [''])[0]))
+        return int(major.group()) if major else 0
+
+    def total_for_page(self, model: str, domain: List, records: List[Dict],
+                       limit: int, offset: int) -> int:
+        """Total records matching the domain, given one page of search_read results."""
+        # A short page already tells us the total
+        if len(records) < limit and (records or offset == 0):
+            return offset + len(records)
+        return self.search_count(model, domain)
+
+    def search_read_parallel(self, model: str, domain: List = None, fields: List[str] = None,
+                             limit: int = 100, offset: int = 0, order: str = None,
+                             workers: int = 4) -> List[Dict]:
+        """
+        Search and read records as concurrent offset/limit pages, one per worker.
+
+        Pages are joined in offset order, so the result matches a single
+        search_read with the same limit and offset. Each page is a separate
+        query, so id is appended to the order to break ties consistently;
+        without an order the pages are sorted by id alone.
+        """
+        # Odoo reads limit 0 as "no limit", which cannot be split into pages
+        if limit <= 0 or workers <= 1:
+            return self.search_read(model, domain, fields, limit, offset, order)
+
+        page_size = -(-limit // workers)
+        pages = [
+            (page_offset, min(page_size, offset + limit - page_offset))
+            for page_offset in range(offset, offset + limit, page_size)
+        ]
+        if len(pages) <= 1:
+            return self.search_read(model, domain, fields, limit, offset, order)
+
+        # Rows that tie on the order could otherwise shift between page queries
+        if not order:
+            order = 'id'
+        elif 'id' not in (term.split()[0].lower() for term in order.split(',') if term.strip()):
+            order = f"{order}, id"
+
+        # Authenticate once up front rather than from every worker
+        if not self.uid:
+            self.authenticate()
+
+        # Over HTTP/2 the pages share one connection instead of opening one each
+        self._enable_http2()
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=len(pages)) as executor:
+            results = executor.map(
+                lambda page: self.search_read(model, domain, fields, page[1], page[0], order),
+                pages
+            )
+            return [record for page in results for record in page]
+
     def search_count(self, model: str, domain: List = None) -> int:
         """Count records matching the domain."""
         domain = domain or []
@@ -294,60 +707,85 @@ class OdooClient:
             kwargs['fields'] = fields
         return self.execute(model, 'read', ids, **kwargs)
 
+    def _cached(self, key: List, fetch) -> Any:
+        """Return fetch() through the disk cache, keyed by server, database, user and key."""
+        if self.cache_ttl <= 0:
+            return fetch()
+
+        key = [self.url, self.db, self.username] + key
+        result = _cache_get(key, self.cache_ttl)
+        if result is None:
+            result = fetch()
+            _cache_put(key, result)
+        return result
+
     def fields_get(self, model: str, attributes: List[str] = None) -> Dict:
-        """Get field definitions for a model."""
-        attributes = attributes or ['string', 'type', 'required', 'readonly', 'help', 'selection']
-        return self.execute(model, 'fields_get', [], {'attributes': attributes})
+        """Get field definitions for a model (untranslated attributes unless asked for)."""
+        attributes = list(attributes or self.CHEAP_FIELD_ATTRIBUTES)
+        return self._cached(
+            ['fields_get', model, attributes],
+            lambda: self.execute(model, 'fields_get', [], attributes=attributes)
+        )
 
     def list_models(self) -> List[Dict]:
         """List all available models."""
-        return self.search_read(
-            'ir.model',
-            [],
-            ['model', 'name', 'info'],
-            limit=500,
-            order='model'
+        return self._cached(
+            ['list_models'],
+            lambda: self.search_read(
+                'ir.model',
+                [],
+                ['model', 'name', 'info'],
+                limit=500,
+                order='model'
+            )
         )
 
 
+# A quoted 'today' literal in a domain string, replaced with the current date
+_TODAY_RE = re.compile(r"""['"]today['"]""")
+
+
 def parse_domain(domain_str: str) -> List:
     """Parse a domain string into a Python list."""
     if not domain_str:
         return []
 
-    try:
-        # Handle date placeholders
-        today = datetime.now().strftime('%Y-%m-%d')
-        domain_str = domain_str.replace("'today'", f"'{today}'")
-        domain_str = domain_str.replace('"today"', f'"{today}"')
+    import ast
 
-        # Safely evaluate the domain
-        return eval(domain_str, {"__builtins__": {}}, {})
+    try:
+        # A domain only holds literals, so there is no need to compile and run it
+        domain = ast.literal_eval(domain_str)
     except Exception as e:
         raise OdooQueryError(
             f"Invalid domain format: {domain_str}",
             "domain",
-            [
-                "Could not parse the domain filter.",
-                "",
-                "Domain format: list of tuples, e.g.:",
-                "  [('field', 'operator', value)]",
-                "",
-                "Examples:",
-                "  [(\'customer_rank\', \'>\', 0)]",
-                "  [(\'name\', \'ilike\', \'%test%\'), (\'active\', \'=\', True)]",
-                "",
-                f"Your domain: {domain_str}",
-                f"Parse error: {str(e)}"
-            ]
+            domain=domain_str,
+            error=str(e)
         )
 
+    # Handle date placeholders
+    if _TODAY_RE.search(domain_str):
+        from datetime import date
+
+        domain = _substitute(domain, 'today', date.today().strftime('%Y-%m-%d'))
+
+    return domain
+
+
+def _substitute(value: Any, placeholder: str, replacement: str) -> Any:
+    """Replace every string equal to placeholder in a parsed domain."""
+    if isinstance(value, list):
+        return [_substitute(item, placeholder, replacement) for item in value]
+    if isinstance(value, tuple):
+        return tuple(_substitute(item, placeholder, replacement) for item in value)
+    return replacement if value == placeholder else value
+
 
 def parse_fields(fields_str: str) -> List[str]:
     """Parse a comma-separated fields string into a list."""
     if not fields_str:
         return []
-    return [f.strip() for f in fields_str.split(',') if f.strip()]
+    return [f for f in map(str.strip, fields_str.split(',')) if f]
 
 
 def parse_ids(ids_str: str) -> List[int]:
@@ -355,28 +793,30 @@ def parse_ids(ids_str: str) -> List[int]:
     if not ids_str:
         return []
     try:
-        return [int(i.strip()) for i in ids_str.split(',') if i.strip()]
+        return list(map(int, filter(None, map(str.strip, ids_str.split(',')))))
     except ValueError as e:
         raise OdooQueryError(
             f"Invalid ID format: {ids_str}",
             "ids",
-            [
-                "IDs must be comma-separated integers.",
-                "Example: --ids \"1,2,3,4,5\"",
-                f"Your input: {ids_str}",
-                f"Error: {str(e)}"
-            ]
+            ids=ids_str,
+            error=str(e)
         )
 
 
-def format_output(data: Any, output_format: str = 'json') -> str:
-    """Format the output data."""
+def format_output(data: Any, output_format: str = 'json') -> bytes:
+    """Format the output data as UTF-8 bytes."""
     if output_format == 'json':
-        return json.dumps(data, indent=2, default=str)
-    return str(data)
+        return json_dumps_indented(data)
+    return str(data).encode('utf-8')
 
 
-def main():
+def write_output(data: Any, output_format: str = 'json', out: Optional[BinaryIO] = None):
+    """Write the formatted output data as bytes (to stdout by default), skipping the text layer."""
+    (out or sys.stdout.buffer).write(format_output(data, output_format) + b'\n')
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Command-line parser, shared by the CLI and the daemon."""
     parser = argparse.ArgumentParser(
         description='Odoo Query Helper - Direct JSON-RPC API Access (READ-ONLY)',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -401,20 +841,28 @@ Examples:
     parser.add_argument('--fields', '-f', help='Comma-separated list of fields to return')
     parser.add_argument('--limit', '-l', type=int, default=100, help='Maximum records to return (default: 100)')
     parser.add_argument('--offset', '-o', type=int, default=0, help='Number of records to skip')
+    parser.add_argument('--parallel', type=int, default=1, help='Fetch a large --limit as this many concurrent pages')
     parser.add_argument('--order', help='Sort order (e.g., "name asc, id desc")')
+    parser.add_argument('--no-total', action='store_true', help='Skip counting all matching records for search_read')
     parser.add_argument('--ids', help='Comma-separated list of IDs to read')
     parser.add_argument('--count', '-c', action='store_true', help='Return count only')
     parser.add_argument('--fields-info', '-i', action='store_true', help='Get field definitions for model')
+    parser.add_argument('--fields-info-full', action='store_true', help='Get field definitions including labels and help texts')
     parser.add_argument('--list-models', action='store_true', help='List all available models')
     parser.add_argument('--format', choices=['json', 'raw'], default='json', help='Output format')
     parser.add_argument('--test-connection', action='store_true', help='Test connection and authentication')
+    parser.add_argument('--no-cache', action='store_true', help='Bypass the disk cache of model metadata and the user ID')
+    parser.add_argument('--cache-ttl', type=int, default=DEFAULT_CACHE_TTL, help=f'Seconds to reuse cached model metadata (default: {DEFAULT_CACHE_TTL})')
     parser.add_argument('--no-ssl-verify', action='store_true', help='Disable SSL certificate verification (use for servers with cert issues)')
+    parser.add_argument('--daemon', action='store_true', help='Serve queries on a local socket, keeping clients authenticated between calls')
+    parser.add_argument('--no-daemon', action='store_true', help='Query Odoo directly even if a daemon is running')
 
-    args = parser.parse_args()
+    return parser
 
-    try:
-        client = OdooClient(verify_ssl=not args.no_ssl_verify)
 
+def run_query(args: argparse.Namespace, client: OdooClient, out: BinaryIO, err: TextIO) -> int:
+    """Run the operation selected by args, writing the result to out and errors to err; returns the exit code."""
+    try:
         # Test connection
         if args.test_connection:
             client.authenticate()
@@ -426,8 +874,8 @@ Examples:
                 "user": client.username,
                 "user_id": client.uid
             }
-            print(format_output(result, args.format))
-            return
+            write_output(result, args.format, out)
+            return 0
 
         # List all models
         if args.list_models:
@@ -437,24 +885,21 @@ Examples:
                 "count": len(models),
                 "models": models
             }
-            print(format_output(result, args.format))
-            return
-
-        # Require model for other operations
-        if not args.model:
-            parser.error("--model is required for this operation")
+            write_output(result, args.format, out)
+            return 0
 
         # Get field definitions
-        if args.fields_info:
-            fields = client.fields_get(args.model)
+        if args.fields_info or args.fields_info_full:
+            attributes = client.FULL_FIELD_ATTRIBUTES if args.fields_info_full else None
+            fields = client.fields_get(args.model, attributes)
             result = {
                 "operation": "fields_get",
                 "model": args.model,
                 "field_count": len(fields),
                 "fields": fields
             }
-            print(format_output(result, args.format))
-            return
+            write_output(result, args.format, out)
+            return 0
 
         # Parse domain
         domain = parse_domain(args.domain)
@@ -468,8 +913,8 @@ Examples:
                 "domain": domain,
                 "count": count
             }
-            print(format_output(result, args.format))
-            return
+            write_output(result, args.format, out)
+            return 0
 
         # Read by IDs
         if args.ids:
@@ -483,22 +928,22 @@ Examples:
                 "record_count": len(records),
                 "records": records
             }
-            print(format_output(result, args.format))
-            return
+            write_output(result, args.format, out)
+            return 0
 
-        # Search and read (default operation)
+        # Search and read (default operation), with the total count for context
         fields = parse_fields(args.fields) if args.fields else None
-        records = client.search_read(
-            args.model,
-            domain,
-            fields,
-            limit=args.limit,
-            offset=args.offset,
-            order=args.order
-        )
-
-        # Get total count for context
-        total_count = client.search_count(args.model, domain)
+        search_args = (args.model, domain, fields, args.limit, args.offset, args.order)
+        if args.parallel > 1:
+            records = client.search_read_parallel(*search_args, workers=args.parallel)
+            total_count = None if args.no_total else client.total_for_page(
+                args.model, domain, records, args.limit, args.offset
+            )
+        elif args.no_total:
+            records = client.search_read(*search_args)
+            total_count = None
+        else:
+            records, total_count = client.search_read_with_total(*search_args)
 
         result = {
             "operation": "search_read",
@@ -511,7 +956,7 @@ Examples:
             "total_matching": total_count,
             "records": records
         }
-        print(format_output(result, args.format))
+        write_output(result, args.format, out)
 
     except OdooQueryError as e:
         error_output = {
@@ -520,8 +965,8 @@ Examples:
             "message": e.message,
             "diagnostics": e.diagnostics
         }
-        print(json.dumps(error_output, indent=2), file=sys.stderr)
-        sys.exit(1)
+        print(json.dumps(error_output, indent=2), file=err)
+        return 1
 
     except Exception as e:
         error_output = {
@@ -536,8 +981,143 @@ Examples:
                 "Please report this issue if it persists."
             ]
         }
-        print(json.dumps(error_output, indent=2), file=sys.stderr)
-        sys.exit(1)
+        print(json.dumps(error_output, indent=2), file=err)
+        return 1
+
+    return 0
+
+
+def _client_config(args: argparse.Namespace) -> Dict[str, Any]:
+    """OdooClient keyword arguments for the parsed command line."""
+    return {
+        "verify_ssl": not args.no_ssl_verify,
+        "cache_ttl": 0 if args.no_cache else args.cache_ttl
+    }
+
+
+# The daemon keeps authenticated clients, with their kept-alive connections,
+# across invocations; it needs Unix domain sockets
+DAEMON_SOCKET = os.path.join(CACHE_DIR, 'sock')
+DAEMON_ENV = ('ODOO_URL', 'ODOO_DB', 'ODOO_USERNAME', 'ODOO_PASSWORD')
+
+
+def query_daemon(argv: List[str]) -> Optional[Dict[str, Any]]:
+    """Run a command line through the daemon; None if no daemon is listening."""
+    if not os.path.exists(DAEMON_SOCKET):
+        return None
+
+    import socket
+
+    request = json_dumps({
+        "argv": argv,
+        "env": {name: os.environ.get(name, '') for name in DAEMON_ENV}
+    })
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(DAEMON_SOCKET)
+            sock.sendall(request + b'\n')
+            sock.shutdown(socket.SHUT_WR)
+            response = b''.join(iter(lambda: sock.recv(65536), b''))
+        return json_loads(response)
+    except (OSError, ValueError):
+        # No daemon (stale socket file) or it went away mid-request
+        return None
+
+
+def serve_daemon():
+    """Serve command lines on DAEMON_SOCKET until interrupted, with one warm client per configuration."""
+    import io
+    import signal
+    import socket
+    import socketserver
+
+    clients: Dict[Tuple, OdooClient] = {}
+    clients_lock = threading.Lock()
+
+    class Handler(socketserver.StreamRequestHandler):
+        def handle(self):
+            request = json_loads(self.rfile.readline())
+            env = {name: request['env'].get(name, '') for name in DAEMON_ENV}
+            out, err = io.BytesIO(), io.StringIO()
+
+            try:
+                args = build_parser().parse_args(request['argv'])
+            except SystemExit as e:
+                code = e.code
+            else:
+                config = _client_config(args)
+                key = tuple(env.values()) + tuple(config.values())
+                with clients_lock:
+                    client = clients.get(key)
+                    if client is None:
+                        client = clients[key] = OdooClient(environ=env, **config)
+                code = run_query(args, client, out, err)
+
+            self.wfile.write(json_dumps({
+                "code": code,
+                "stdout": out.getvalue().decode('utf-8'),
+                "stderr": err.getvalue()
+            }))
+
+    if not hasattr(socketserver, 'ThreadingUnixStreamServer'):
+        sys.exit("--daemon needs Unix domain sockets, which this platform lacks")
+
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    if os.path.exists(DAEMON_SOCKET):
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            if sock.connect_ex(DAEMON_SOCKET) == 0:
+                sys.exit(f"A daemon is already listening on {DAEMON_SOCKET}")
+        os.unlink(DAEMON_SOCKET)
+
+    # Requests carry the caller's credentials, so only this user may connect
+    old_umask = os.umask(0o177)
+    try:
+        server = socketserver.ThreadingUnixStreamServer(DAEMON_SOCKET, Handler)
+    finally:
+        os.umask(old_umask)
+    server.daemon_threads = True
+
+    # Stopping with SIGTERM goes through the same cleanup as Ctrl+C
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+
+    print(f"Serving on {DAEMON_SOCKET}", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        os.unlink(DAEMON_SOCKET)
+        for client in clients.values():
+            client.close()
+
+
+def main():
+    parser = build_parser()
+    args = parser.parse_args()
+
+    if args.daemon:
+        serve_daemon()
+        return
+
+    # Require model for operations other than the connection test and model list
+    if not (args.test_connection or args.list_models or args.model):
+        parser.error("--model is required for this operation")
+
+    response = None if args.no_daemon else query_daemon(sys.argv[1:])
+    if response is not None:
+        sys.stdout.buffer.write(response['stdout'].encode('utf-8'))
+        sys.stderr.write(response['stderr'])
+        code = response['code']
+    else:
+        client = OdooClient(**_client_config(args))
+        try:
+            code = run_query(args, client, sys.stdout.buffer, sys.stderr)
+        finally:
+            client.close()
+
+    if code:
+        sys.exit(code)
 
 
 if __name__ == '__main__':
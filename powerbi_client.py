@@ -0,0 +1,308 @@
+"""
+powerbi_client.py
+================================
+Shared Power BI / Fabric REST client for the Python MCP servers
+
+Provides token acquisition, a single pooled HTTP/2 client, cached
+GET requests and Long Running Operation polling. Both
+fabric-model-reader-mcp.py and fabric-workspace-reader-mcp.py import from
+here so they share one connection pool and one token cache.
+"""
+
+
+#region Imports
+import subprocess
+import sys
+import json
+import os
+import time
+import platform
+import base64
+import asyncio
+import httpx
+import orjson
+import keyring
+from typing import Optional, Dict, Any, Iterable, Set, Tuple
+
+# Optional: MSAL lets us reuse the Azure CLI token cache in-process
+try:
+    import msal
+except ImportError:
+    msal = None
+#endregion
+
+
+#region Configuration
+# API endpoint constants
+POWERBI_API = "https://api.powerbi.com/v1.0/myorg"
+FABRIC_API = "https://api.fabric.microsoft.com/v1"
+
+# On Windows the Azure CLI is a batch wrapper; invoke az.cmd directly instead of via a shell
+AZ_EXECUTABLE = "az.cmd" if platform.system() == "Windows" else "az"
+
+# Azure CLI's public client ID and token cache, reused for silent MSAL acquisition
+AZURE_CLI_CLIENT_ID = "04b07795-8ddb-461a-bbee-02f9e1bf7b46"
+AZURE_CLI_TOKEN_CACHE = os.path.join(os.path.expanduser("~"), ".azure", "msal_token_cache.json")
+AZURE_AUTHORITY = "https://login.microsoftonline.com/organizations"
+POWERBI_SCOPES = ["https://analysis.windows.net/powerbi/api/.default"]
+
+# First LRO status poll delay in seconds; doubles on every poll up to Retry-After
+LRO_INITIAL_DELAY = 0.25
+#endregion
+
+
+#region Authentication
+def _get_msal_token() -> str:
+    """
+    Silently acquires a token from the MSAL cache written by `az login`.
+    Returns an empty string when msal is not installed, the cache is missing
+    (e.g. encrypted on Windows) or no cached account can be refreshed.
+    """
+    if msal is None or not os.path.isfile(AZURE_CLI_TOKEN_CACHE):
+        return ""
+    try:
+        cache = msal.SerializableTokenCache()
+        with open(AZURE_CLI_TOKEN_CACHE, "r", encoding="utf-8") as f:
+            cache.deserialize(f.read())
+        app = msal.PublicClientApplication(AZURE_CLI_CLIENT_ID, authority=AZURE_AUTHORITY, token_cache=cache)
+        for account in app.get_accounts():
+            result = app.acquire_token_silent(POWERBI_SCOPES, account=account)
+            if result and "access_token" in result:
+                return result["access_token"]
+    except Exception as e:
+        print(f"MSAL token cache lookup failed: {str(e)}", file=sys.stderr)
+    return ""
+
+
+# Authentication function
+def get_access_token() -> str:
+    """Get access token in 1 of 4 different methods."""
+    # 1. First try to get token from environment variable
+    #    Store token in mcp.json securely as a password
+    #    or set it in your environment: export POWERBI_TOKEN
+    token = os.environ.get("POWERBI_TOKEN", "")
+    if token:
+        return token
+
+    # 2. Try the Azure CLI token cache in-process via MSAL (no subprocess)
+    #    Run `az login` to authenticate first
+    token = _get_msal_token()
+    if token:
+        return token
+
+    # 3. Try Azure CLI
+    #    Run `az login` to authenticate first
+    try:
+        result = subprocess.run(
+            [AZ_EXECUTABLE, "account", "get-access-token", "--resource", "https://analysis.windows.net/powerbi/api"],
+            capture_output=True, 
+            text=True, 
+            check=True
+        )
+        token_data = json.loads(result.stdout)
+        return token_data.get("accessToken", "")
+    except subprocess.CalledProcessError as e:
+        print(f"Azure CLI error: {e.stderr}", file=sys.stderr)
+    except Exception as e:
+        print(f"Azure CLI auth failed: {str(e)}", file=sys.stderr)
+
+    # 4. Try keyring as fallback
+    #    Run `keyring set powerbi token` to store your token securely
+    try:
+        return keyring.get_password("powerbi", "token") or ""
+    except Exception:
+        return ""
+
+# Token cache; populated lazily on first request and refreshed shortly before expiry
+# A failed lookup is remembered for TOKEN_RETRY_INTERVAL seconds so requests don't re-spawn the Azure CLI
+TOKEN_REFRESH_MARGIN = 60
+TOKEN_FALLBACK_TTL = 3000
+TOKEN_RETRY_INTERVAL = 30
+_token_cache: Dict[str, Any] = {"value": None, "exp": 0.0}
+_token_lock = asyncio.Lock()
+
+
+def _token_expiry(token: str) -> float:
+    """Reads the `exp` claim from a JWT payload (no signature check); falls back to a fixed TTL."""
+    try:
+        payload = token.split(".")[1]
+        claims = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+        return float(claims["exp"])
+    except Exception:
+        return time.time() + TOKEN_FALLBACK_TTL
+
+
+async def _auth_header() -> str:
+    """Returns the Authorization header value, acquiring or refreshing the token when needed."""
+    if time.time() > _token_cache["exp"] - TOKEN_REFRESH_MARGIN:
+        async with _token_lock:
+            if time.time() > _token_cache["exp"] - TOKEN_REFRESH_MARGIN:
+                # get_access_token may spawn the Azure CLI; keep it off the event loop
+                token = await asyncio.to_thread(get_access_token)
+                if not token:
+                    # stdout carries the MCP stdio protocol; diagnostics go to stderr
+                    print("WARNING: No authentication token found. Please authenticate using one of these methods:\n"
+                          "1. Set POWERBI_TOKEN environment variable\n"
+                          "2. Run 'az login' (Azure CLI)\n"
+                          "3. Use 'keyring set powerbi token' to store token", file=sys.stderr)
+                    _token_cache["value"] = ""
+                    _token_cache["exp"] = time.time() + TOKEN_REFRESH_MARGIN + TOKEN_RETRY_INTERVAL
+                else:
+                    _token_cache["value"] = token
+                    _token_cache["exp"] = _token_expiry(token)
+    return f"Bearer {_token_cache['value']}"
+#endregion
+
+
+#region HTTP Client
+# Create async HTTP/2 client with default headers
+# Connections are kept alive and multiplexed across concurrent tool calls;
+# the Authorization header is attached per request so token refreshes take effect.
+# The pool is sized for bursts of concurrent tool calls and the transport retries failed connects.
+POOL_SIZE = 32
+client = httpx.AsyncClient(
+    headers={
+        "Content-Type": "application/json"
+    },
+    timeout=httpx.Timeout(30.0),
+    transport=httpx.AsyncHTTPTransport(
+        http2=True,
+        retries=3,
+        limits=httpx.Limits(max_connections=POOL_SIZE, max_keepalive_connections=POOL_SIZE)
+    )
+)
+
+# Transient responses retried with exponential backoff (RETRY_BACKOFF * 2**attempt seconds)
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+MAX_RETRIES = 3
+RETRY_BACKOFF = 0.3
+
+
+async def send(method: str, url: str, data: Optional[Dict[str, Any]] = None) -> httpx.Response:
+    """
+    Sends an authenticated request.
+    Retries transient 429/5xx responses, honoring a numeric Retry-After header.
+    Returns the last response.
+    """
+    attempt = 0
+    while True:
+        response = await client.request(method, url, json=data,
+                                        headers={"Authorization": await _auth_header()})
+        if response.status_code not in RETRY_STATUSES or attempt == MAX_RETRIES:
+            return response
+        try:
+            delay = float(response.headers.get("Retry-After", ""))
+        except ValueError:
+            delay = RETRY_BACKOFF * 2 ** attempt
+        attempt += 1
+        await asyncio.sleep(delay)
+
+
+# Cache for idempotent GET requests: (method, url) -> (created_at, future)
+# The future is stored before it completes so concurrent callers share one in-flight request
+# Entries are kept in insertion (= creation time) order so expired ones can be swept from the front
+CACHE_TTL_SECONDS = 60
+_cache: Dict[Tuple[str, str], Tuple[float, "asyncio.Future[Dict[str, Any]]"]] = {}
+
+
+async def _do_request(url: str, method: str, data: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Performs the HTTP request and normalizes failures into an error dict."""
+    try:
+        response = await send(method, url, data)
+        return orjson.loads(response.content) if response.is_success else {"error": f"HTTP {response.status_code}: {response.text[:200]}"}
+    except Exception as e:
+        return {"error": str(e)}
+
+
+# Function to make API requests with error handling
+async def make_request(url: str, method: str = "GET", data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Makes an HTTP request to the specified URL.
+    Supports GET and POST methods with JSON data.
+    GET responses are cached for CACHE_TTL_SECONDS; errors are never cached.
+    Returns JSON response or error message.
+    """
+    if method != "GET":
+        return await _do_request(url, method, data)
+    
+    key = (method, url)
+    now = time.monotonic()
+    cached = _cache.get(key)
+    if cached and now - cached[0] < CACHE_TTL_SECONDS:
+        return await asyncio.shield(cached[1])
+    
+    # Drop expired entries, including URLs that are never requested again
+    _cache.pop(key, None)
+    while _cache:
+        oldest = next(iter(_cache))
+        if now - _cache[oldest][0] < CACHE_TTL_SECONDS:
+            break
+        del _cache[oldest]
+    
+    future = asyncio.ensure_future(_do_request(url, method, data))
+    _cache[key] = (now, future)
+    result = await asyncio.shield(future)
+    if "error" in result and _cache.get(key, (0.0, None))[1] is future:
+        del _cache[key]
+    return result
+
+
+# Endpoints (last URL path segment) that rejected an OData $select projection
+_select_unsupported: Set[str] = set()
+
+
+async def make_select_request(url: str, fields: Iterable[str]) -> Dict[str, Any]:
+    """
+    Makes a cached GET request asking the API to return only `fields` via $select.
+    Falls back to the full listing (and remembers the endpoint) if the projection is rejected with HTTP 400.
+    """
+    endpoint = url.rsplit("/", 1)[-1]
+    if endpoint not in _select_unsupported:
+        result = await make_request(f"{url}?$select={','.join(fields)}")
+        if not str(result.get("error", "")).startswith("HTTP 400"):
+            return result
+        _select_unsupported.add(endpoint)
+    return await make_request(url)
+
+
+def invalidate(url_prefix: str = "") -> None:
+    """Drops cached GET responses whose URL starts with url_prefix (all entries by default)."""
+    for key in [k for k in _cache if k[1].startswith(url_prefix)]:
+        del _cache[key]
+
+
+# Function for LRO (Long Running Operation) handling
+async def wait_for_operation(location_url: str, retry_after: float = 30) -> Dict[str, Any]:
+    """
+    Waits for a long-running operation to complete.
+    Polls the provided location URL with exponential backoff (starting at
+    LRO_INITIAL_DELAY seconds, capped at retry_after) until the operation is done.
+    Returns the final result or an error message.
+    """
+    delay = LRO_INITIAL_DELAY
+    while True:
+        await asyncio.sleep(delay)
+        response = await send("GET", location_url)
+        
+        # Throttled: wait exactly as long as the server asks before the next poll
+        if response.status_code == 429:
+            try:
+                delay = float(response.headers.get('Retry-After', retry_after))
+            except ValueError:
+                delay = retry_after
+            continue
+        
+        if not response.is_success:
+            return {"error": f"Failed to check status: {response.status_code}"}
+        
+        data = orjson.loads(response.content)
+        status = data.get('status', '')
+        
+        if status == 'Succeeded':
+            result_response = await send("GET", f"{location_url}/result")
+            return orjson.loads(result_response.content) if result_response.is_success else {"error": "Failed to get result"}
+        elif status == 'Failed':
+            return {"error": data.get('error', 'Operation failed')}
+        
+        delay = min(delay * 2, retry_after)
+#endregion